@@ -0,0 +1,33 @@
+#version 150
+
+uniform sampler2D p3d_Texture0;
+uniform vec4 p3d_ColorScale;
+uniform struct {
+  vec4 ambient;
+} p3d_LightModel;
+uniform struct {
+  vec4 color;
+  vec4 position;
+} p3d_LightSource[2];
+
+in vec3 view_pos;
+in vec3 view_normal;
+in vec4 vertex_color;
+in vec2 texcoord;
+
+out vec4 color;
+
+void main() {
+  vec3 normal = normalize(view_normal);
+  vec3 light = p3d_LightModel.ambient.rgb;
+  for (int i = 0; i < 2; ++i) {
+    // position.w is 0 for directional lights, then position.xyz is the direction towards the light
+    vec3 light_dir = p3d_LightSource[i].position.xyz - view_pos * p3d_LightSource[i].position.w;
+    float light_dist = length(light_dir);
+    if (light_dist > 0.0) {
+      light += p3d_LightSource[i].color.rgb * max(dot(normal, light_dir / light_dist), 0.0);
+    }
+  }
+  vec4 base_color = texture(p3d_Texture0, texcoord) * vertex_color * p3d_ColorScale;
+  color = vec4(base_color.rgb * light, base_color.a);
+}
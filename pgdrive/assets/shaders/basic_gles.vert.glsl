@@ -0,0 +1,25 @@
+#version 300 es
+
+// A fixed shader used instead of the auto shader generator: vertex color, the first texture and lambert lighting
+
+uniform mat4 p3d_ModelViewProjectionMatrix;
+uniform mat4 p3d_ModelViewMatrix;
+uniform mat3 p3d_NormalMatrix;
+
+in vec4 p3d_Vertex;
+in vec3 p3d_Normal;
+in vec4 p3d_Color;
+in vec2 p3d_MultiTexCoord0;
+
+out vec3 view_pos;
+out vec3 view_normal;
+out vec4 vertex_color;
+out vec2 texcoord;
+
+void main() {
+  view_pos = (p3d_ModelViewMatrix * p3d_Vertex).xyz;
+  view_normal = normalize(p3d_NormalMatrix * p3d_Normal);
+  vertex_color = p3d_Color;
+  texcoord = p3d_MultiTexCoord0;
+  gl_Position = p3d_ModelViewProjectionMatrix * p3d_Vertex;
+}
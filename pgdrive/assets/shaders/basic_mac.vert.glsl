@@ -0,0 +1,25 @@
+#version 120
+
+// A fixed shader used instead of the auto shader generator: vertex color, the first texture and lambert lighting
+
+uniform mat4 p3d_ModelViewProjectionMatrix;
+uniform mat4 p3d_ModelViewMatrix;
+uniform mat3 p3d_NormalMatrix;
+
+attribute vec4 p3d_Vertex;
+attribute vec3 p3d_Normal;
+attribute vec4 p3d_Color;
+attribute vec2 p3d_MultiTexCoord0;
+
+varying vec3 view_pos;
+varying vec3 view_normal;
+varying vec4 vertex_color;
+varying vec2 texcoord;
+
+void main() {
+  view_pos = (p3d_ModelViewMatrix * p3d_Vertex).xyz;
+  view_normal = normalize(p3d_NormalMatrix * p3d_Normal);
+  vertex_color = p3d_Color;
+  texcoord = p3d_MultiTexCoord0;
+  gl_Position = p3d_ModelViewProjectionMatrix * p3d_Vertex;
+}
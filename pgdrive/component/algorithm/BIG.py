@@ -1,6 +1,7 @@
 import logging
 from typing import Union
 
+import numpy as np
 from panda3d.core import NodePath
 
 from pgdrive.component.algorithm.blocks_prob_dist import PGBlockConfig
@@ -36,7 +37,9 @@ class BIG:
         physics_world: PhysicsWorld,
         # block_type_version: str,
         exit_length=50,
-        random_seed=None
+        random_seed=None,
+        max_trials: int = 10000,
+        max_backtracks: int = 200
     ):
         super(BIG, self).__init__()
         self._block_sequence = None
@@ -51,6 +54,10 @@ class BIG:
         self._global_network = global_network
         self.blocks = []
         self._exit_length = exit_length
+        # restart generation with a new seed when the backtracking gets stuck on a bad seed
+        self.max_trials = max_trials
+        self.max_backtracks = max_backtracks
+        self._restart_num = 0
         first_block = FirstPGBlock(
             self._global_network,
             self._lane_width,
@@ -61,6 +68,16 @@ class BIG:
         )
         self.blocks.append(first_block)
         self.next_step = NextStep.forward
+        self._block_types = PGBlockConfig.all_blocks()
+        # same normalized CDF as np.random.choice(p=...), so sampling results are unchanged
+        self._block_cdf = np.cumsum(PGBlockConfig.block_probability(), dtype=np.float64)
+        self._block_cdf /= self._block_cdf[-1]
+        self._step_funcs = {
+            NextStep.forward: self._forward,
+            NextStep.destruct_current: self._destruct_current,
+            NextStep.search_sibling: self._search_sibling,
+            NextStep.back: self._go_back
+        }
         # assert block_type_version in ["v1", "v2"]
         # self.block_type_version = block_type_version
 
@@ -74,36 +91,70 @@ class BIG:
         elif generate_method == BigGenerateMethod.BLOCK_SEQUENCE:
             assert isinstance(parameter, str), "When generating map from block sequence, the parameter should be a str"
             self.block_num = len(parameter) + 1
-            self._block_sequence = FirstPGBlock.ID + parameter
-        while True:
-            if self.big_helper_func():
-                break
+            self._block_sequence = self._resolve_block_sequence(parameter)
+        self._generate_blocks()
         return self._global_network
 
+    def _generate_blocks(self):
+        step_funcs = self._step_funcs
+        trials = 0
+        backtracks = 0
+        while len(self.blocks) < self.block_num or self.next_step != NextStep.forward:
+            trials += 1
+            if self.next_step == NextStep.back:
+                backtracks += 1
+            if trials > self.max_trials or backtracks > self.max_backtracks:
+                self._restart(trials, backtracks)
+                trials = 0
+                backtracks = 0
+                continue
+            step_funcs[self.next_step]()
+
+    def _restart(self, trials, backtracks):
+        """
+        Destruct all blocks except the first one and restart generation with a new random seed
+        """
+        self._restart_num += 1
+        logging.info(
+            "BIG restarts map generation after {} trials and {} backtracks, restart num: {}".format(
+                trials, backtracks, self._restart_num
+            )
+        )
+        # Only the last block may have been destructed already, when we are going to search its sibling or go back.
+        # A failed block waiting for destruct_current is still in the global network, so it is destructed here
+        last_destructed = self.next_step in (NextStep.search_sibling, NextStep.back)
+        constructed = self.blocks[1:-1] if last_destructed else self.blocks[1:]
+        for block in constructed:
+            self.destruct(block)
+        del self.blocks[1:]
+        seed = None if self.random_seed is None else self.random_seed + self._restart_num
+        self.np_random = get_np_random(seed)
+        self.next_step = NextStep.forward
+
     def big_helper_func(self):
+        """
+        Run one step of BIG, return True when the map is finished. Used to drive BIG from a task in show_base loop
+        """
         if len(self.blocks) >= self.block_num and self.next_step == NextStep.forward:
             return True
-        if self.next_step == NextStep.forward:
-            self._forward()
-        elif self.next_step == NextStep.destruct_current:
-            self._destruct_current()
-        elif self.next_step == NextStep.search_sibling:
-            self._search_sibling()
-        elif self.next_step == NextStep.back:
-            self._go_back()
+        self._step_funcs[self.next_step]()
         return False
 
+    @staticmethod
+    def _resolve_block_sequence(sequence: str):
+        """
+        Convert block IDs to block types in advance, the first element is always FirstPGBlock
+        """
+        return [FirstPGBlock] + [PGBlockConfig.get_block(type_id) for type_id in sequence]
+
     def sample_block(self) -> PGBlock:
         """
         Sample a random block type
         """
         if self._block_sequence is None:
-            block_types = PGBlockConfig.all_blocks()
-            block_probabilities = PGBlockConfig.block_probability()
-            block_type = self.np_random.choice(block_types, p=block_probabilities)
+            block_type = self._sample_block_type()
         else:
-            type_id = self._block_sequence[len(self.blocks)]
-            block_type = PGBlockConfig.get_block(type_id)
+            block_type = self._block_sequence[len(self.blocks)]
 
         socket = self.np_random.choice(self.blocks[-1].get_socket_indices())
         block = block_type(
@@ -115,11 +166,15 @@ class BIG:
         )
         return block
 
+    def _sample_block_type(self):
+        index = int(self._block_cdf.searchsorted(self.np_random.random_sample(), side="right"))
+        return self._block_types[index]
+
     def destruct(self, block):
         block.destruct_block(self._physics_world)
 
     def construct(self, block) -> bool:
-        return block.construct_block(self._render_node_path, self._physics_world)
+        return block.construct_block(self._render_node_path, self._physics_world, skip_failed_block=True)
 
     def _forward(self):
         logging.debug("forward")
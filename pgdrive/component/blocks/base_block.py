@@ -62,6 +62,7 @@ class BaseBlock(BaseObject, DrivableAreaProperty):
             self.side_texture.setAnisotropicDegree(8)
             self.side_normal = self.loader.loadTexture(AssetLoader.file_path("textures", "sidewalk", "normal.png"))
             self.sidewalk = self.loader.loadModel(AssetLoader.file_path("models", "box.bam"))
+            self.lane_line_model = self.loader.loadModel(AssetLoader.file_path("models", "box.bam"))
 
     def _sample_topology(self) -> bool:
         """
@@ -74,10 +75,13 @@ class BaseBlock(BaseObject, DrivableAreaProperty):
         root_render_np: NodePath,
         physics_world: PhysicsWorld,
         extra_config: Dict = None,
-        no_same_node=True
+        no_same_node=True,
+        skip_failed_block=False
     ) -> bool:
         """
         Randomly Construct a block, if overlap return False
+        :param skip_failed_block: don't create the render and physics nodes of an overlapping block. Set it if the
+        caller always destructs such block, like BIG does, since building the meshes dominates each trial
         """
         self.sample_parameters()
         self.origin = NodePath(self.name)
@@ -91,6 +95,10 @@ class BaseBlock(BaseObject, DrivableAreaProperty):
         self._clear_topology()
         success = self._sample_topology()
         self._global_network.add(self.block_network, no_same_node)
+        if not success and skip_failed_block:
+            return success
+        # Blocks are built one after another, since each block starts from a socket of the previous one. The physics
+        # part is many small box/plane nodes created from Python, so it is not worth moving to worker threads
         self._create_in_world()
         self.attach_to_world(root_render_np, physics_world)
         return success
@@ -154,6 +162,7 @@ class BaseBlock(BaseObject, DrivableAreaProperty):
                 for _id, l in enumerate(lanes):
                     line_color = l.line_color
                     self._add_lane(l, _id, line_color)
+        # Flatten per block instead of the whole scene, so that a block can still be detached or destructed alone
         self.lane_line_node_path.flattenStrong()
         self.lane_line_node_path.node().collect()
 
@@ -327,7 +336,7 @@ class BaseBlock(BaseObject, DrivableAreaProperty):
         else:
             node_name = BodyName.Broken_line
 
-        # add bullet body for it
+        # add bullet body for it. The visual line below is parented to this body, so even vis-only scripts build it
         if straight_stripe:
             body_np = parent_np.attachNewNode(node_name)
         else:
@@ -357,11 +366,11 @@ class BaseBlock(BaseObject, DrivableAreaProperty):
         body_np.setQuat(LQuaternionf(math.cos(theta / 2), 0, 0, math.sin(theta / 2)))
 
         if self.render:
-            # For visualization
-            lane_line = self.loader.loadModel(AssetLoader.file_path("models", "box.bam"))
+            # For visualization. Copy the preloaded model instead of instancing it, so that flattenStrong() can still
+            # bake the transform of each copy into one merged Geom
+            lane_line = self.lane_line_model.copyTo(body_np)
             lane_line.setScale(length, DrivableAreaProperty.LANE_LINE_WIDTH, DrivableAreaProperty.LANE_LINE_THICKNESS)
             lane_line.setPos(Vec3(0, 0 - DrivableAreaProperty.LANE_LINE_GHOST_HEIGHT / 2))
-            lane_line.reparentTo(body_np)
             body_np.set_color(color)
 
     def _add_sidewalk2bullet(self, lane_start, lane_end, middle, radius=0.0, direction=0):
@@ -96,6 +96,7 @@ def CreateRoadFrom(
             end = side_lane.position(side_lane.length, width)
             side_lane.start = start
             side_lane.end = end
+            side_lane.update_properties()
         elif isinstance(lane, CircularLane):
             clockwise = True if lane.direction == 1 else False
             radius1 = lane.radius
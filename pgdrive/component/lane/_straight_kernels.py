@@ -0,0 +1,65 @@
+"""
+Numeric kernels of StraightLane. They are compiled by Numba if it is installed, otherwise the NumPy implementations
+are used. fastmath is not enabled, so that the generated maps are identical with and without Numba.
+"""
+import logging
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _position(start, direction, direction_lateral, longitudinal, lateral):
+    return start + longitudinal * direction + lateral * direction_lateral
+
+
+def _local_coordinates_batch(positions, start, direction, direction_lateral):
+    basis = np.empty((2, 2))
+    basis[:, 0] = direction
+    basis[:, 1] = direction_lateral
+    return (positions - start) @ basis
+
+
+def _numba_position(start, direction, direction_lateral, longitudinal, lateral):
+    # NumPy casts the scalars to the dtype of the lane geometry, do the same so that the results are identical
+    longitudinal = start.dtype.type(longitudinal)
+    lateral = start.dtype.type(lateral)
+    out = np.empty(2, dtype=start.dtype)
+    out[0] = start[0] + longitudinal * direction[0] + lateral * direction_lateral[0]
+    out[1] = start[1] + longitudinal * direction[1] + lateral * direction_lateral[1]
+    return out
+
+
+def _numba_local_coordinates_batch(positions, start, direction, direction_lateral):
+    # float64 like the NumPy version, whose basis matrix is float64 whatever the dtype of the lane geometry is
+    out = np.empty((positions.shape[0], 2), dtype=np.float64)
+    for i in range(positions.shape[0]):
+        delta_x = positions[i, 0] - start[0]
+        delta_y = positions[i, 1] - start[1]
+        out[i, 0] = delta_x * direction[0] + delta_y * direction[1]
+        out[i, 1] = delta_x * direction_lateral[0] + delta_y * direction_lateral[1]
+    return out
+
+
+if njit is not None:
+    position = njit(cache=True)(_numba_position)
+    local_coordinates_batch = njit(cache=True)(_numba_local_coordinates_batch)
+else:
+    position = _position
+    local_coordinates_batch = _local_coordinates_batch
+
+
+def warm_up_kernels():
+    """
+    Trigger the JIT compilation, so that it happens when launching the engine instead of the first frame
+    """
+    if njit is None:
+        return
+    logging.debug("Compile StraightLane kernels")
+    start = np.zeros(2, dtype=np.float32)
+    direction, direction_lateral = np.array([1.0, 0.0], dtype=np.float32), np.array([0.0, 1.0], dtype=np.float32)
+    position(start, direction, direction_lateral, 1.0, 1.0)
+    local_coordinates_batch(np.zeros((1, 2)), start, direction, direction_lateral)
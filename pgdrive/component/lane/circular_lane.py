@@ -46,7 +46,9 @@ class CircularLane(AbstractLane):
     def position(self, longitudinal: float, lateral: float) -> Vector:
         phi = self.direction * longitudinal / self.radius + self.start_phase
         # return self.center + (self.radius - lateral * self.direction) * np.array([math.cos(phi), math.sin(phi)])
-        return self.center + (self.radius - lateral * self.direction) * Vector((math.cos(phi), math.sin(phi)))
+        # Same as center + r * Vector((cos, sin)), written out to skip the temporary Vectors and scalar checks
+        r = self.radius - lateral * self.direction
+        return Vector((self.center[0] + math.cos(phi) * r, self.center[1] + math.sin(phi) * r))
 
     def heading_at(self, longitudinal: float) -> float:
         phi = self.direction * longitudinal / self.radius + self.start_phase
@@ -3,9 +3,9 @@ from typing import Tuple, Sequence, Union
 
 import numpy as np
 
+from pgdrive.component.lane import _straight_kernels
 from pgdrive.component.lane.abs_lane import AbstractLane
 from pgdrive.constants import LineType
-from pgdrive.utils.math_utils import norm
 
 
 class StraightLane(AbstractLane):
@@ -32,26 +32,35 @@ class StraightLane(AbstractLane):
         """
         super(StraightLane, self).__init__()
         self.set_speed_limit(speed_limit)
-        self.start = np.array(start)
-        self.end = np.array(end)
+        self.start = start
+        self.end = end
         self.width = width
         self.line_types = line_types or [LineType.BROKEN, LineType.BROKEN]
         self.forbidden = forbidden
         self.priority = priority
-        self.length = norm((self.end - self.start)[0], (self.end - self.start)[1])
-        self.heading = math.atan2(self.end[1] - self.start[1], self.end[0] - self.start[0])
-        self.direction = (self.end - self.start) / self.length
-        self.direction_lateral = np.array([-self.direction[1], self.direction[0]])
+        self.update_properties()
 
     def update_properties(self):
-        super(StraightLane, self).__init__()
-        self.length = norm((self.end - self.start)[0], (self.end - self.start)[1])
-        self.heading = math.atan2(self.end[1] - self.start[1], self.end[0] - self.start[0])
-        self.direction = (self.end - self.start) / self.length
-        self.direction_lateral = np.array([-self.direction[1], self.direction[0]])
+        # lane geometry is stored in float32, which is precise enough at meter scale and halves the memory footprint
+        self.start = np.asarray(self.start, dtype=np.float32)
+        self.end = np.asarray(self.end, dtype=np.float32)
+        delta_x = float(self.end[0]) - float(self.start[0])
+        delta_y = float(self.end[1]) - float(self.start[1])
+        self.length = math.hypot(delta_x, delta_y)
+        inv_length = 1.0 / self.length
+        dx, dy = delta_x * inv_length, delta_y * inv_length
+        self.heading = math.atan2(dy, dx)
+        self.direction = np.array((dx, dy), dtype=np.float32)
+        self.direction_lateral = np.array((-dy, dx), dtype=np.float32)
+        # The lane geometry as Python floats for local_coordinates(), which is called several times per vehicle per
+        # step. Converting from float32 is exact, so it is the same geometry as the arrays
+        self._frame = (
+            float(self.start[0]), float(self.start[1]), float(self.direction[0]), float(self.direction[1]),
+            float(self.direction_lateral[0]), float(self.direction_lateral[1])
+        )
 
     def position(self, longitudinal: float, lateral: float) -> np.ndarray:
-        return self.start + longitudinal * self.direction + lateral * self.direction_lateral
+        return _straight_kernels.position(self.start, self.direction, self.direction_lateral, longitudinal, lateral)
 
     def heading_at(self, longitudinal: float) -> float:
         return self.heading
@@ -60,11 +69,23 @@ class StraightLane(AbstractLane):
         return self.width
 
     def local_coordinates(self, position: Tuple[float, float]) -> Tuple[float, float]:
-        delta_x = position[0] - self.start[0]
-        delta_y = position[1] - self.start[1]
-        longitudinal = delta_x * self.direction[0] + delta_y * self.direction[1]
-        lateral = delta_x * self.direction_lateral[0] + delta_y * self.direction_lateral[1]
-        return float(longitudinal), float(lateral)
+        start_x, start_y, direction_x, direction_y, lateral_x, lateral_y = self._frame
+        delta_x = float(position[0]) - start_x
+        delta_y = float(position[1]) - start_y
+        longitudinal = delta_x * direction_x + delta_y * direction_y
+        lateral = delta_x * lateral_x + delta_y * lateral_y
+        return longitudinal, lateral
+
+    def local_coordinates_batch(self, positions: Union[np.ndarray, Sequence[Sequence[float]]]) -> np.ndarray:
+        """
+        Convert a batch of physx_world positions to local lane coordinates in one call.
+
+        :param positions: array-like with shape (N, 2)
+        :return: array with shape (N, 2), each row is (longitudinal, lateral)
+        """
+        return _straight_kernels.local_coordinates_batch(
+            np.asarray(positions, dtype=np.float64), self.start, self.direction, self.direction_lateral
+        )
 
     def reset_start_end(self, start: Union[np.ndarray, Sequence[float]], end: Union[np.ndarray, Sequence[float]]):
         super(StraightLane, self).__init__()
@@ -114,6 +114,8 @@ class BaseMap(BaseRunnable):
             json_config[self.PRE_BLOCK_SOCKET_INDEX] = b.pre_block_socket_index
             map_config.append(json_config)
 
+        # get_serializable_dict() only rebuilds the dict levels and shares leaf values with the block configs, so the
+        # saved data is detached here once. Callers such as dump_all_maps() rely on this and don't copy it again
         saved_data = copy.deepcopy({self.BLOCK_SEQUENCE: map_config})
         return saved_data
 
@@ -3,8 +3,6 @@ from typing import Union
 from panda3d.core import NodePath
 
 from pgdrive.component.algorithm.BIG import BIG
-from pgdrive.component.algorithm.blocks_prob_dist import PGBlockConfig
-from pgdrive.component.blocks.first_block import FirstPGBlock
 from pgdrive.component.blocks.pg_block import PGBlock
 from pgdrive.component.map.base_map import BaseMap
 from pgdrive.component.road.road_network import RoadNetwork
@@ -56,10 +54,8 @@ class CityBIG(BIG):
         elif generate_method == BigGenerateMethod.BLOCK_SEQUENCE:
             assert isinstance(parameter, str), "When generating map from block sequence, the parameter should be a str"
             self.block_num = len(parameter) + 1
-            self._block_sequence = FirstPGBlock.ID + parameter
-        while True:
-            if self.big_helper_func():
-                break
+            self._block_sequence = self._resolve_block_sequence(parameter)
+        self._generate_blocks()
         return self._global_network
 
     def sample_block(self) -> PGBlock:
@@ -67,12 +63,9 @@ class CityBIG(BIG):
         Sample a random block type
         """
         if self._block_sequence is None:
-            block_types = PGBlockConfig.all_blocks()
-            block_probabilities = PGBlockConfig.block_probability()
-            block_type = self.np_random.choice(block_types, p=block_probabilities)
+            block_type = self._sample_block_type()
         else:
-            type_id = self._block_sequence[len(self.blocks)]
-            block_type = PGBlockConfig.get_block(type_id)
+            block_type = self._block_sequence[len(self.blocks)]
 
         # exclude first block
         socket_used = set([block.pre_block_socket for block in self.blocks[1:]])
@@ -7,16 +7,22 @@ from pgdrive.utils.scene_utils import get_lanes_on_road
 LaneIndex = Tuple[str, str, int]
 Route = List[LaneIndex]
 
+# (start_node, end_node) -> road id. Roads are used as keys of sets and dicts a lot, so they are hashed and compared
+# by this integer instead of two strings
+_ROAD_IDS = {}
+
 
 class Road:
     """
     Road is a bunch of lanes connecting two nodes, one start and the other end
     """
+    __slots__ = ("start_node", "end_node", "_id")
     NEGATIVE_DIR = "-"
 
     def __init__(self, start_node: str, end_node: str):
         self.start_node = start_node
         self.end_node = end_node
+        self._id = _ROAD_IDS.setdefault((start_node, end_node), len(_ROAD_IDS))
 
     def get_lanes(self, road_network):
         return get_lanes_on_road(self, road_network)
@@ -49,7 +55,7 @@ class Road:
 
     def __eq__(self, other):
         if isinstance(other, Road):
-            return True if self.start_node == other.start_node and self.end_node == other.end_node else False
+            return self._id == other._id
         else:
             return super(Road, self).__eq__(other)
 
@@ -57,7 +63,11 @@ class Road:
         return "Road from {} to {}".format(self.start_node, self.end_node)
 
     def __hash__(self):
-        return hash((self.start_node, self.end_node))
+        return self._id
+
+    def __reduce__(self):
+        # ids are only valid in this process, so rebuild the road from its nodes when copying or unpickling it
+        return Road, (self.start_node, self.end_node)
 
     def to_json(self):
         return (self.start_node, self.end_node)
@@ -25,6 +25,8 @@ class RoadNetwork:
         self._graph_helper = None
         self.debug = debug
         self.is_initialized = False
+        # from -> to -> box of the roads added by add(), see get_road_bounding_box()
+        self._road_bounding_boxes = {}
 
     def after_init(self):
         assert not self.is_initialized
@@ -43,13 +45,28 @@ class RoadNetwork:
         dec_lanes = self.get_all_decoration_lanes() + other.get_all_decoration_lanes()
         self.graph.update(copy.copy(other.graph))
         self.update_decoration_lanes(dec_lanes)
+        self._add_road_bounding_boxes(other.graph)
         return self
 
+    def _add_road_bounding_boxes(self, graph):
+        """
+        A network is added after its block is constructed, so its lanes won't move anymore. The boxes of its roads are
+        computed once here, since the roads in the global network are checked again and again by new blocks
+        """
+        for _from, to_dict in graph.items():
+            if _from == Decoration.start:
+                continue
+            self._road_bounding_boxes[_from] = {
+                _to: get_road_bounding_box(lanes)
+                for _to, lanes in to_dict.items() if len(lanes) != 0
+            }
+
     def __isub__(self, other):
         intersection = self.graph.keys() & other.graph.keys() - {Decoration.start, Decoration.end}
         if len(intersection) != 0:
             for k in intersection:
                 self.graph.pop(k, None)
+                self._road_bounding_boxes.pop(k, None)
         if Decoration.start in other.graph.keys():
             for lane in other.graph[Decoration.start][Decoration.end]:
                 if lane in self.graph[Decoration.start][Decoration.end]:
@@ -77,6 +94,7 @@ class RoadNetwork:
 
     def clear(self):
         self.graph.clear()
+        self._road_bounding_boxes.clear()
 
     def get_positive_lanes(self):
         """
@@ -117,6 +135,20 @@ class RoadNetwork:
         res_x_max, res_x_min, res_y_max, res_y_min = get_boxes_bounding_box(boxes)
         return res_x_min, res_x_max, res_y_min, res_y_max
 
+    def get_road_bounding_box(self, _from: str, _to: str) -> Tuple:
+        """
+        Return (x_max, x_min, y_max, y_min) of the road between two nodes. The boxes of roads added by add() are
+        computed in advance, others are computed when querying
+        """
+        box = self._road_bounding_boxes.get(_from, {}).get(_to)
+        if box is None:
+            box = get_road_bounding_box(self.graph[_from][_to])
+        return box
+
+    def _remove_road_bounding_box(self, _from: str, _to: str):
+        if _from in self._road_bounding_boxes:
+            self._road_bounding_boxes[_from].pop(_to, None)
+
     def remove_all_roads(self, start_node: str, end_node: str):
         """
         Remove all road between two road nodes
@@ -135,6 +167,7 @@ class RoadNetwork:
     def remove_road(self, road):
         assert isinstance(road, Road), "Only Road Type can be deleted"
         ret = self.graph[road.start_node].pop(road.end_node)
+        self._remove_road_bounding_box(road.start_node, road.end_node)
         if len(self.graph[road.start_node]) == 0:
             self.graph.pop(road.start_node)
         return ret
@@ -146,6 +179,7 @@ class RoadNetwork:
         if road.end_node not in self.graph[road.start_node]:
             self.graph[road.start_node][road.end_node] = []
         self.graph[road.start_node][road.end_node] += lanes
+        self._remove_road_bounding_box(road.start_node, road.end_node)
 
     def add_lane(self, _from: str, _to: str, lane: AbstractLane) -> None:
         """
@@ -160,6 +194,7 @@ class RoadNetwork:
         if _to not in self.graph[_from]:
             self.graph[_from][_to] = []
         self.graph[_from][_to].append(lane)
+        self._remove_road_bounding_box(_from, _to)
 
     def _init_graph_helper(self):
         self._graph_helper = GraphLookupTable(self.graph, self.debug)
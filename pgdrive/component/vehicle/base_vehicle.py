@@ -212,6 +212,8 @@ class BaseVehicle(BaseObject, BaseVehicleState):
             self.engine.global_config["vehicle_config"]["show_lane_line_detector"]
         )
 
+        # The lidar is kept even with num_lasers=0 (e.g. top-down envs), since policies query surrounding objects
+        # through it. Ray casting is already skipped in that case, as every perceive() is guarded by lidar.available
         self.lidar = Lidar(
             config["lidar"]["num_lasers"], config["lidar"]["distance"],
             self.engine.global_config["vehicle_config"]["show_lidar"]
@@ -68,6 +68,9 @@ class DistanceDetector:
         vehicle_position = base_vehicle.position
         heading_theta = base_vehicle.heading_theta
         assert not isinstance(detector_mask, str), "Please specify detector_mask either with None or a numpy array."
+        if detector_mask is not None and self.cloud_points_vis is None and not detector_mask.any():
+            # nothing can be hit by any laser, so skip all ray tests
+            return detect_result(cloud_points=[1.0] * self.num_lasers, detected_objects=[])
         cloud_points, detected_objects, colors = cutils.cutils_perceive(
             cloud_points=np.ones((self.num_lasers, ), dtype=float),
             detector_mask=detector_mask.astype(dtype=np.uint8) if detector_mask is not None else None,
@@ -1,3 +1,4 @@
+import heapq
 import math
 from pgdrive.component.lane.abs_lane import AbstractLane
 from typing import Set
@@ -54,9 +55,11 @@ class Lidar(DistanceDetector):
 
     def get_surrounding_vehicles_info(self, ego_vehicle, detected_objects, num_others: int = 4):
         from pgdrive.utils.math_utils import norm, clip
-        surrounding_vehicles = list(self.get_surrounding_vehicles(detected_objects))
-        surrounding_vehicles.sort(
-            key=lambda v: norm(ego_vehicle.position[0] - v.position[0], ego_vehicle.position[1] - v.position[1])
+        ego_x, ego_y = ego_vehicle.position
+        surrounding_vehicles = heapq.nsmallest(
+            num_others,
+            self.get_surrounding_vehicles(detected_objects),
+            key=lambda v: norm(ego_x - v.position[0], ego_y - v.position[1])
         )
         surrounding_vehicles += [None] * num_others
         res = []
@@ -1,7 +1,7 @@
+import functools
 import logging
 import os
 import pathlib
-import sys
 
 from pgdrive.utils.utils import is_win
 
@@ -12,6 +12,8 @@ class AssetLoader:
     """
     loader = None
     asset_path = None
+    # asset_path in the unix style used by Panda3d, file paths are built by joining relative paths to it
+    _asset_prefix = None
 
     @staticmethod
     def init_loader(engine):
@@ -21,6 +23,8 @@ class AssetLoader:
         root_path = pathlib.PurePosixPath(__file__).parent.parent if not is_win() else pathlib.Path(__file__).resolve(
         ).parent.parent
         AssetLoader.asset_path = root_path.joinpath("assets")
+        AssetLoader._asset_prefix = AssetLoader.windows_style2unix_style(AssetLoader.asset_path
+                                                                         ) if is_win() else str(AssetLoader.asset_path)
         if engine.win is None:
             logging.debug("Physics world mode")
             return
@@ -39,14 +43,14 @@ class AssetLoader:
         return panda_path
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def file_path(*path_string):
         """
-        Usage is the same as path.join(dir_1,dir_2,file_name)
+        Usage is the same as path.join(dir_1,dir_2,file_name). Results are cached until close_asset_loader() is called
         :param path_string: a tuple
         :return: file path used to load asset
         """
-        path = AssetLoader.asset_path.joinpath(*path_string)
-        return AssetLoader.windows_style2unix_style(path) if sys.platform.startswith("win") else str(path)
+        return AssetLoader._asset_prefix + "/" + "/".join(path_string)
 
     @classmethod
     def load_model(cls, file_path):
@@ -58,6 +62,18 @@ class AssetLoader:
         assert cls.loader is not None
         return cls.loader.loadModel(file_path)
 
+    @classmethod
+    def preload_models(cls, file_paths, callback=None):
+        """
+        Load several models asynchronously in one call. Loaded models are kept in the model pool of Panda3D, so the
+        following load_model() calls of these files return immediately
+        :param file_paths: a list of path in string, usually use the return value of AssetLoader.file_path()
+        :param callback: will be called with the loaded models as parameters, when all models are loaded
+        :return: the request, which can be used to check the status or cancel loading
+        """
+        assert cls.loader is not None
+        return cls.loader.loadModel(list(file_paths), callback=callback, blocking=False)
+
     @classmethod
     def initialized(cls):
         return cls.asset_path is not None
@@ -80,3 +96,5 @@ def close_asset_loader():
     cls = AssetLoader
     cls.loader = None
     cls.asset_path = None
+    cls._asset_prefix = None
+    cls.file_path.cache_clear()
@@ -3,6 +3,9 @@ import logging
 from pgdrive.constants import BodyName
 from pgdrive.utils.utils import get_object_from_node
 
+# the vehicle only cares about contacts with nodes of these names, others (terrain, lanes, ...) are skipped early
+_CRASH_NODE_NAMES = frozenset([BodyName.Vehicle, BodyName.Traffic_object, BodyName.InvisibleWall, BodyName.TollGate])
+
 
 def collision_callback(contact):
     """
@@ -14,23 +17,29 @@ def collision_callback(contact):
     node0 = contact.getNode0()
     node1 = contact.getNode1()
 
-    nodes = [node0, node1]
-    another_nodes = [node1, node0]
-    for i in range(2):
-        if nodes[i].hasPythonTag(BodyName.Vehicle):
-            obj_1 = get_object_from_node(nodes[i])
-            obj_2 = get_object_from_node(another_nodes[i])
-            another_node_name = another_nodes[i].getName()
-            # crash vehicles
-            if another_node_name == BodyName.Vehicle:
-                obj_1.crash_vehicle = True
-            # crash objects
-            elif another_node_name == BodyName.Traffic_object:
-                if not obj_2.crashed:
-                    obj_1.crash_object = True
-                    if obj_2.COST_ONCE:
-                        obj_2.crashed = True
-            # crash invisible wall or building
-            elif another_node_name in [BodyName.InvisibleWall, BodyName.TollGate]:
-                obj_1.crash_building = True
-            # logging.debug("{} crash with {}".format(nodes[i].getName(), another_nodes[i].getName()))
+    # Most contacts are between vehicles and the road surface. Filter them by node name before touching any python
+    # object, since this function is called for every contact in every physics step
+    name0 = node0.getName()
+    name1 = node1.getName()
+    if name1 in _CRASH_NODE_NAMES and node0.hasPythonTag(BodyName.Vehicle):
+        _process_vehicle_contact(node0, node1, name1)
+    if name0 in _CRASH_NODE_NAMES and node1.hasPythonTag(BodyName.Vehicle):
+        _process_vehicle_contact(node1, node0, name0)
+
+
+def _process_vehicle_contact(vehicle_node, another_node, another_node_name):
+    obj_1 = get_object_from_node(vehicle_node)
+    # crash vehicles
+    if another_node_name == BodyName.Vehicle:
+        obj_1.crash_vehicle = True
+    # crash objects
+    elif another_node_name == BodyName.Traffic_object:
+        obj_2 = get_object_from_node(another_node)
+        if not obj_2.crashed:
+            obj_1.crash_object = True
+            if obj_2.COST_ONCE:
+                obj_2.crashed = True
+    # crash invisible wall or building
+    else:
+        obj_1.crash_building = True
+    # logging.debug("{} crash with {}".format(vehicle_node.getName(), another_node.getName()))
@@ -2,12 +2,11 @@ import logging
 import time
 from typing import Optional, Union
 
-import gltf
-from direct.gui.OnscreenImage import OnscreenImage
 from direct.showbase import ShowBase
 from panda3d.bullet import BulletDebugNode
-from panda3d.core import AntialiasAttrib, loadPrcFileData, LineSegs, PythonCallbackObject
+from panda3d.core import AntialiasAttrib, loadPrcFileData, LineSegs, PythonCallbackObject, Shader
 
+from pgdrive.component.lane._straight_kernels import warm_up_kernels
 from pgdrive.constants import RENDER_MODE_OFFSCREEN, RENDER_MODE_NONE, RENDER_MODE_ONSCREEN, EDITION, CamMask, \
     BKG_COLOR
 from pgdrive.engine.asset_loader import AssetLoader, initialize_asset_loader, close_asset_loader
@@ -20,43 +19,59 @@ from pgdrive.engine.core.sky_box import SkyBox
 from pgdrive.engine.core.terrain import Terrain
 from pgdrive.utils.utils import is_mac, setup_logger
 
+# Static prc config, which is loaded in one call. Other useful options:
+# "transform-cache 0", "state-cache 0", "framebuffer-srgb true", "geom-cache-size 50000",
+# "sync-video 1" (v-sync, it seems useless), "gl-version 3 2" (for debug use)
+_STATIC_PRC = "\n".join(
+    [
+        "window-title {}".format(EDITION),
+        "framebuffer-multisample 1",
+        "multisamples 8",
+        "bullet-filter-algorithm groups-mask",
+        "audio-library-name null",
+        # textures are kept in the model cache as well, so that they are not decoded again in the next launch
+        "model-cache-textures 1",
+        "model-cache-compressed-textures 1",
+        "garbage-collect-states 0",
+        # threads used by asynchronous model loading
+        "loader-num-threads 4",
+    ]
+)
+
+_SUPPRESS_WARNING_PRC = "\n".join(
+    [
+        "notify-level-glgsg fatal",
+        "notify-level-pgraph fatal",
+        "notify-level-pnmimage fatal",
+        "notify-level-thread fatal",
+        "notify-level-bullet fatal",
+    ]
+)
+
+_FREE_WARNING_PRC = "\n".join(
+    [
+        "notify-level-glgsg debug",
+        # "notify-level-pgraph debug",  # press 4 to use toggle analyze to do this
+        "notify-level-pnmimage debug",
+        "notify-level-thread debug",
+    ]
+)
+
+# the callback object is stateless, so it is created once and shared by all physics worlds
+_COLLISION_CALLBACK = PythonCallbackObject(collision_callback)
+
 
 def _suppress_warning():
-    loadPrcFileData("", "notify-level-glgsg fatal")
-    loadPrcFileData("", "notify-level-pgraph fatal")
-    loadPrcFileData("", "notify-level-pnmimage fatal")
-    loadPrcFileData("", "notify-level-thread fatal")
-    loadPrcFileData("", "notify-level-bullet fatal")
+    loadPrcFileData("", _SUPPRESS_WARNING_PRC)
 
 
 def _free_warning():
-    loadPrcFileData("", "notify-level-glgsg debug")
-    # loadPrcFileData("", "notify-level-pgraph debug")  # press 4 to use toggle analyze to do this
-    loadPrcFileData("", "notify-level-pnmimage debug")
-    loadPrcFileData("", "notify-level-thread debug")
+    loadPrcFileData("", _FREE_WARNING_PRC)
 
 
 class EngineCore(ShowBase.ShowBase):
     DEBUG = False
-    loadPrcFileData("", "window-title {}".format(EDITION))
-    loadPrcFileData("", "framebuffer-multisample 1")
-    loadPrcFileData("", "multisamples 8")
-    loadPrcFileData("", 'bullet-filter-algorithm groups-mask')
-    loadPrcFileData("", "audio-library-name null")
-    loadPrcFileData("", "model-cache-compressed-textures 1")
-
-    # loadPrcFileData("", "transform-cache 0")
-    # loadPrcFileData("", "state-cache 0")
-    loadPrcFileData("", "garbage-collect-states 0")
-
-    # loadPrcFileData("", " framebuffer-srgb truein")
-    # loadPrcFileData("", "geom-cache-size 50000")
-
-    # v-sync, it seems useless
-    # loadPrcFileData("", "sync-video 1")
-
-    # for debug use
-    # loadPrcFileData("", "gl-version 3 2")
+    loadPrcFileData("", _STATIC_PRC)
 
     def __init__(self, global_config):
         self.global_config = global_config
@@ -82,6 +97,9 @@ class EngineCore(ShowBase.ShowBase):
         if is_mac() and (self.mode == RENDER_MODE_OFFSCREEN):  # Mac don't support offscreen rendering
             self.mode = RENDER_MODE_ONSCREEN
 
+        # key -> callback of the shortcuts, registered in one go so that they can be ignored cleanly when closing
+        self._key_handlers = {}
+
         # Setup some debug options
         if self.global_config["headless_machine_render"]:
             # headless machine support
@@ -91,17 +109,20 @@ class EngineCore(ShowBase.ShowBase):
             EngineCore.DEBUG = True
             _free_warning()
             setup_logger(debug=True)
-            self.accept('1', self.toggleDebug)
-            self.accept('2', self.toggleWireframe)
-            self.accept('3', self.toggleTexture)
-            self.accept('4', self.toggleAnalyze)
+            self._key_handlers.update(
+                {
+                    '1': self.toggleDebug,
+                    '2': self.toggleWireframe,
+                    '3': self.toggleTexture,
+                    '4': self.toggleAnalyze
+                }
+            )
         else:
             # only report fatal error when debug is False
             _suppress_warning()
             # a special debug mode
             if self.global_config["debug_physics_world"]:
-                self.accept('1', self.toggleDebug)
-                self.accept('4', self.toggleAnalyze)
+                self._key_handlers.update({'1': self.toggleDebug, '4': self.toggleAnalyze})
 
         super(EngineCore, self).__init__(windowType=self.mode)
 
@@ -149,33 +170,48 @@ class EngineCore(ShowBase.ShowBase):
 
         if not self.global_config["debug_physics_world"] and (self.mode in [RENDER_MODE_ONSCREEN, RENDER_MODE_OFFSCREEN
                                                                             ]):
+            # gltf and OnscreenImage are only needed when rendering, import them lazily to speed up import pgdrive
+            import gltf
             initialize_asset_loader(self)
             gltf.patch_loader(self.loader)
+            self._preload_models()
 
             # Display logo
             if self.mode == RENDER_MODE_ONSCREEN and (not self.global_config["debug"]) \
                     and (not self.global_config["fast"]):
+                from direct.gui.OnscreenImage import OnscreenImage
                 self._loading_logo = OnscreenImage(
                     image=AssetLoader.file_path("PGDrive-large.png"),
                     pos=(0, 0, 0),
                     scale=(self.w_scale, 1, self.h_scale)
                 )
                 self._loading_logo.setTransparency(True)
-                for i in range(20):
-                    self.graphicsEngine.renderFrame()
+                # upload the logo texture in advance, then two frames are enough to show it in both buffers
+                self._loading_logo.getTexture().prepare(self.win.getGsg().getPreparedObjects())
+                self.graphicsEngine.openWindows()
+                self.graphicsEngine.renderFrame()
+                self.graphicsEngine.renderFrame()
                 self.taskMgr.add(self.remove_logo, "remove _loading_logo in first frame")
 
-        self.closed = False
+        # compile numeric kernels when launching the engine, instead of the first frame
+        warm_up_kernels()
 
-        # add element to render and pbr render, if is exists all the time.
-        # these element will not be removed when clear_world() is called
-        self.pbr_render = self.render.attachNewNode("pbrNP")
+        self.closed = False
 
         # attach node to this root root whose children nodes will be clear after calling clear_world()
         self.worldNP = self.render.attachNewNode("world_np")
 
-        # same as worldNP, but this node is only used for render gltf model with pbr material
-        self.pbr_worldNP = self.pbr_render.attachNewNode("pbrNP")
+        self.use_pbr = self.mode != RENDER_MODE_NONE and self.global_config["use_pbr"]
+        if self.use_pbr:
+            # the root of gltf models with pbr material, the pbr pipeline is applied on it.
+            # It also plays the role of worldNP for pbr models, so its children will be cleared by clear_world(), while
+            # the node itself is kept to avoid an extra level of empty node in the scene graph
+            self.pbr_render = self.render.attachNewNode("pbrNP")
+            self.pbr_worldNP = self.pbr_render
+        else:
+            # no pbr pipeline, pbr models are rendered as normal models
+            self.pbr_render = self.render
+            self.pbr_worldNP = self.worldNP
         self.debug_node = None
 
         # some render attribute
@@ -184,9 +220,12 @@ class EngineCore(ShowBase.ShowBase):
 
         # physics world
         self.physics_world = PhysicsWorld(self.global_config["debug_static_world"])
+        # physics is stepped in the main thread, so that managers always observe a settled world between sub-steps.
+        # The step size is fixed, look it up once instead of in every sub-step
+        self._physics_step_size = self.global_config["physics_world_step_size"]
 
         # collision callback
-        self.physics_world.dynamic_world.setContactAddedCallback(PythonCallbackObject(collision_callback))
+        self.physics_world.dynamic_world.setContactAddedCallback(_COLLISION_CALLBACK)
 
         # for real time simulation
         self.force_fps = ForceFPS(self, start=True)
@@ -198,24 +237,25 @@ class EngineCore(ShowBase.ShowBase):
         # init other world elements
         if self.mode != RENDER_MODE_NONE:
 
-            from pgdrive.engine.core.our_pbr import OurPipeline
-            self.pbrpipe = OurPipeline(
-                render_node=None,
-                window=None,
-                camera_node=None,
-                msaa_samples=4,
-                max_lights=8,
-                use_normal_maps=False,
-                use_emission_maps=True,
-                exposure=1.0,
-                enable_shadows=False,
-                enable_fog=False,
-                use_occlusion_maps=False
-            )
-            self.pbrpipe.render_node = self.pbr_render
-            self.pbrpipe.render_node.set_antialias(AntialiasAttrib.M_auto)
-            self.pbrpipe._recompile_pbr()
-            self.pbrpipe.manager.cleanup()
+            if self.use_pbr:
+                from pgdrive.engine.core.our_pbr import OurPipeline
+                self.pbrpipe = OurPipeline(
+                    render_node=None,
+                    window=None,
+                    camera_node=None,
+                    msaa_samples=4,
+                    max_lights=8,
+                    use_normal_maps=False,
+                    use_emission_maps=True,
+                    exposure=1.0,
+                    enable_shadows=False,
+                    enable_fog=False,
+                    use_occlusion_maps=False
+                )
+                self.pbrpipe.render_node = self.pbr_render
+                self.pbrpipe.render_node.set_antialias(AntialiasAttrib.M_auto)
+                self.pbrpipe._recompile_pbr()
+                self.pbrpipe.manager.cleanup()
 
             # set main cam
             self.cam.node().setCameraMask(CamMask.MainCam)
@@ -233,7 +273,10 @@ class EngineCore(ShowBase.ShowBase):
             self.render.setLight(self.world_light.direction_np)
             self.render.setLight(self.world_light.ambient_np)
 
-            self.render.setShaderAuto()
+            if self.global_config["shader_auto"]:
+                self.render.setShaderAuto()
+            else:
+                self.render.setShader(self._load_basic_shader())
             self.render.setAntialias(AntialiasAttrib.MAuto)
 
             # ui and render property
@@ -247,15 +290,32 @@ class EngineCore(ShowBase.ShowBase):
             self._show_help_message = False
             self._episode_start_time = time.time()
 
-            self.accept("h", self.toggle_help_message)
-            self.accept("f", self.force_fps.toggle)
+            self._key_handlers.update({"h": self.toggle_help_message, "f": self.force_fps.toggle})
 
         else:
             self.on_screen_message = None
 
+        for key, handler in self._key_handlers.items():
+            self.accept(key, handler)
+
         # task manager
         self.taskMgr.remove('audioLoop')
 
+    @staticmethod
+    def _preload_models():
+        """
+        Load models used by most scenes in background threads, while the engine is being set up.
+        gltf models are excluded, since they can only be loaded by the patched loader in main thread
+        """
+        AssetLoader.preload_models(
+            [
+                AssetLoader.file_path("models", "box.bam"),
+                AssetLoader.file_path("models", "skybox.bam"),
+                AssetLoader.file_path("models", "yugo", "yugotireR.egg"),
+                AssetLoader.file_path("models", "yugo", "yugotireL.egg"),
+            ]
+        )
+
     def render_frame(self, text: Optional[Union[dict, str]] = None):
         """
         The real rendering is conducted by the igLoop task maintained by panda3d.
@@ -273,8 +333,21 @@ class EngineCore(ShowBase.ShowBase):
         # if self.highway_render is not None:
         #     self.highway_render.render()
 
+    def _load_basic_shader(self):
+        if self.global_config["headless_machine_render"]:
+            vert_file, frag_file = "basic_gles.vert.glsl", "basic_gles.frag.glsl"
+        elif is_mac():
+            vert_file, frag_file = "basic_mac.vert.glsl", "basic_mac.frag.glsl"
+        else:
+            vert_file, frag_file = "basic.vert.glsl", "basic.frag.glsl"
+        return Shader.load(
+            Shader.SL_GLSL,
+            vertex=AssetLoader.file_path("shaders", vert_file),
+            fragment=AssetLoader.file_path("shaders", frag_file)
+        )
+
     def step_physics_world(self):
-        dt = self.global_config["physics_world_step_size"]
+        dt = self._physics_step_size
         self.physics_world.dynamic_world.doPhysics(dt, 1, dt)
 
     def _debug_mode(self):
@@ -319,10 +392,15 @@ class EngineCore(ShowBase.ShowBase):
                 self.taskMgr.mgr.getNumTaskChains(), self.taskMgr.getAllTasks()
             )
         )
+        for key in self._key_handlers:
+            self.ignore(key)
+        self._key_handlers.clear()
         self.physics_world.dynamic_world.clearContactAddedCallback()
         self.physics_world.destroy()
         self.destroy()
         close_asset_loader()
+        SkyBox.clear_model_collection()
+        Terrain.clear_shared_assets()
 
         import sys
         if sys.version_info >= (3, 0):
@@ -334,7 +412,8 @@ class EngineCore(ShowBase.ShowBase):
 
     def clear_world(self):
         self.worldNP.removeNode()
-        self.pbr_worldNP.removeNode()
+        if self.use_pbr:
+            self.pbr_worldNP.node().removeAllChildren()
 
     def toggle_help_message(self):
         if self.on_screen_message:
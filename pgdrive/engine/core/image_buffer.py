@@ -90,14 +90,14 @@ class ImageBuffer:
 
     @staticmethod
     def convert_to_array(img, clip=True):
+        # called for every pixel of each observation, so look the method and the ranges up only once
+        get_gray = img.getGray
+        x_range, y_range = range(img.getXSize()), range(img.getYSize())
         if not clip:
-            numpy_array = np.array(
-                [[int(img.getGray(i, j) * 255) for j in range(img.getYSize())] for i in range(img.getXSize())],
-                dtype=np.uint8
-            )
+            numpy_array = np.array([[int(get_gray(i, j) * 255) for j in y_range] for i in x_range], dtype=np.uint8)
             return np.clip(numpy_array, 0, 255)
         else:
-            numpy_array = np.array([[img.getGray(i, j) for j in range(img.getYSize())] for i in range(img.getXSize())])
+            numpy_array = np.array([[get_gray(i, j) for j in y_range] for i in x_range])
             return np.clip(numpy_array, 0, 1)
 
     def add_display_region(self, display_region: List[float]):
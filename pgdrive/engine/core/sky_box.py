@@ -12,12 +12,37 @@ class SkyBox(BaseObject):
     """
     ROTATION_MAX = 5000
 
+    # the sky box model is immutable, share it with all sky boxes using the same shader in this process
+    model_collection = {}
+
     def __init__(self, pure_background: bool = False):
         super(SkyBox, self).__init__(random_seed=0)
         self._accumulate = 0
         self.f = 1
         if not self.render or pure_background:
             return
+        gles = ConfigVariableString("load-display").getValue()
+        if gles == "pandagles2":
+            vert_file = "skybox_gles.vert.glsl"
+            frag_file = "skybox_gles.frag.glsl"
+        elif is_mac():
+            vert_file = "skybox_mac.vert.glsl"
+            frag_file = "skybox_mac.frag.glsl"
+        else:
+            vert_file = "skybox.vert.glsl"
+            frag_file = "skybox.frag.glsl"
+        if vert_file not in SkyBox.model_collection:
+            SkyBox.model_collection[vert_file] = self._load_skybox(vert_file, frag_file)
+        SkyBox.model_collection[vert_file].instanceTo(self.origin)
+
+    @classmethod
+    def clear_model_collection(cls):
+        """
+        Drop the shared models when the engine whose loader loaded them is closed
+        """
+        cls.model_collection.clear()
+
+    def _load_skybox(self, vert_file, frag_file):
         skybox = self.loader.loadModel(AssetLoader.file_path("models", "skybox.bam"))
 
         skybox.hide(CamMask.MiniMap | CamMask.RgbCam | CamMask.Shadow | CamMask.ScreenshotCam)
@@ -31,27 +56,13 @@ class SkyBox(BaseObject):
         skybox_texture.set_anisotropic_degree(16)
         skybox.set_texture(skybox_texture)
 
-        gles = ConfigVariableString("load-display").getValue()
-        if gles == "pandagles2":
-            skybox_shader = Shader.load(
-                Shader.SL_GLSL, AssetLoader.file_path("shaders", "skybox_gles.vert.glsl"),
-                AssetLoader.file_path("shaders", "skybox_gles.frag.glsl")
-            )
-        else:
-            if is_mac():
-                vert_file = "skybox_mac.vert.glsl"
-                frag_file = "skybox_mac.frag.glsl"
-            else:
-                vert_file = "skybox.vert.glsl"
-                frag_file = "skybox.frag.glsl"
-            skybox_shader = Shader.load(
-                Shader.SL_GLSL, AssetLoader.file_path("shaders", vert_file),
-                AssetLoader.file_path("shaders", frag_file)
-            )
+        skybox_shader = Shader.load(
+            Shader.SL_GLSL, AssetLoader.file_path("shaders", vert_file), AssetLoader.file_path("shaders", frag_file)
+        )
         skybox.set_shader(skybox_shader)
-        skybox.reparentTo(self.origin)
         skybox.setZ(-4400)
         skybox.setH(30)
+        return skybox
 
     def step(self):
         if not self.render:
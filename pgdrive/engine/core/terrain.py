@@ -1,7 +1,7 @@
 # import numpy
 import math
 from panda3d.bullet import BulletRigidBodyNode, BulletPlaneShape
-from panda3d.core import Vec3, CardMaker, LQuaternionf, TextureStage, Texture, SamplerState
+from panda3d.core import Vec3, CardMaker, LQuaternionf, TextureStage, Texture, SamplerState, NodePath
 
 from pgdrive.base_class.base_object import BaseObject
 from pgdrive.constants import BodyName, CamMask, CollisionGroup
@@ -12,6 +12,18 @@ class Terrain(BaseObject):
     COLLISION_MASK = CollisionGroup.Terrain
     HEIGHT = 0.0
 
+    # the texture and card geometry are immutable, share them with all terrains created in this process
+    terrain_texture = None
+    card_model = None
+
+    @classmethod
+    def clear_shared_assets(cls):
+        """
+        Drop the shared texture and card when the engine whose loader loaded them is closed
+        """
+        cls.terrain_texture = None
+        cls.card_model = None
+
     def __init__(self):
         super(Terrain, self).__init__(random_seed=0)
         shape = BulletPlaneShape(Vec3(0, 0, 1), 0)
@@ -28,23 +40,28 @@ class Terrain(BaseObject):
             # self.terrain_normal = self.loader.loadTexture(
             #     AssetLoader.file_path( "textures", "grass2", "normal.jpg")
             # )
-            self.terrain_texture = self.loader.loadTexture(AssetLoader.file_path("textures", "ground.png"))
-            self.terrain_texture.setWrapU(Texture.WM_repeat)
-            self.terrain_texture.setWrapV(Texture.WM_repeat)
+            scale = 20000
+            if Terrain.terrain_texture is None:
+                terrain_texture = self.loader.loadTexture(AssetLoader.file_path("textures", "ground.png"))
+                terrain_texture.setWrapU(Texture.WM_repeat)
+                terrain_texture.setWrapV(Texture.WM_repeat)
+                terrain_texture.setMinfilter(SamplerState.FT_linear_mipmap_linear)
+                terrain_texture.setAnisotropicDegree(8)
+                Terrain.terrain_texture = terrain_texture
+
+                cm = CardMaker('card')
+                cm.setUvRange((0, 0), (scale / 10, scale / 10))
+                Terrain.card_model = NodePath(cm.generate())
             self.ts_color = TextureStage("color")
             self.ts_normal = TextureStage("normal")
             self.ts_normal.set_mode(TextureStage.M_normal)
             self.origin.setPos(0, 0, self.HEIGHT)
-            cm = CardMaker('card')
-            scale = 20000
-            cm.setUvRange((0, 0), (scale / 10, scale / 10))
-            card = self.origin.attachNewNode(cm.generate())
+            card = self.origin.attachNewNode("card")
+            Terrain.card_model.instanceTo(card)
             # scale = 1 if self.use_hollow else 20000
             card.set_scale(scale)
             card.setPos(-scale / 2, -scale / 2, -0.1)
             card.setZ(-.05)
             card.setTexture(self.ts_color, self.terrain_texture)
             # card.setTexture(self.ts_normal, self.terrain_normal)
-            self.terrain_texture.setMinfilter(SamplerState.FT_linear_mipmap_linear)
-            self.terrain_texture.setAnisotropicDegree(8)
             card.setQuat(LQuaternionf(math.cos(-math.pi / 4), math.sin(-math.pi / 4), 0, 0))
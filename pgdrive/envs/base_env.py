@@ -79,6 +79,11 @@ BASE_DEFAULT_CONFIG = dict(
     headless_machine_render=False,
     # turn on to profile the efficiency
     pstats=False,
+    # render gltf models with pbr pipeline. Turn off to skip compiling pbr shaders when rendering is not for human
+    use_pbr=True,
+    # generate shaders for the scene automatically. Turn off to use a fixed lambert shader without shadows, which
+    # avoids the stall of generating a shader when a new material/light combination appears
+    shader_auto=True,
 
     # ===== Others =====
     # The maximum distance used in PGLOD. Set to None will use the default values.
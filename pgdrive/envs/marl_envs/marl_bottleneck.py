@@ -85,7 +85,7 @@ class MultiAgentBottleneckEnv(MultiAgentPGDrive):
         )
 
     def get_single_observation(self, vehicle_config: "Config") -> "ObservationBase":
-        return LidarStateObservationMARound(vehicle_config)
+        return LidarStateObservationMARound(vehicle_config, self)
 
     def reward_function(self, vehicle_id: str):
         """
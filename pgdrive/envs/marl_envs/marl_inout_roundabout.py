@@ -1,4 +1,5 @@
-import copy
+import heapq
+
 from pgdrive.manager.spawn_manager import SpawnManager
 
 import gym
@@ -64,9 +65,9 @@ class MARoundaboutMap(PGMap):
 
 
 class LidarStateObservationMARound(ObservationBase):
-    def __init__(self, vehicle_config):
+    def __init__(self, vehicle_config, env=None):
         self.state_obs = StateObservation(vehicle_config)
-        super(LidarStateObservationMARound, self).__init__(vehicle_config)
+        super(LidarStateObservationMARound, self).__init__(vehicle_config, env)
         self.state_length = list(self.state_obs.observation_space.shape)[0]
         self.cloud_points = None
         self.detected_objects = None
@@ -81,33 +82,40 @@ class LidarStateObservationMARound(ObservationBase):
 
     def observe(self, vehicle):
         num_others = self.config["lidar"]["num_others"]
-        state = self.state_observe(vehicle)
-        other_v_info = []
+        # collect the arrays of all parts and concatenate them once, instead of converting them to python lists
+        obs_parts = [self.state_observe(vehicle)]
         if vehicle.lidar.available:
             cloud_points, detected_objects = vehicle.lidar.perceive(vehicle)
             if self.config["lidar"]["num_others"] > 0:
-                surrounding_vehicles = list(vehicle.lidar.get_surrounding_vehicles(detected_objects))
-                surrounding_vehicles.sort(
-                    key=lambda v: norm(vehicle.position[0] - v.position[0], vehicle.position[1] - v.position[1])
+                # candidates are already pruned by the broad phase of lidar, only keep the nearest num_others of them
+                ego_x, ego_y = vehicle.position
+                surrounding_vehicles = heapq.nsmallest(
+                    num_others,
+                    vehicle.lidar.get_surrounding_vehicles(detected_objects),
+                    key=lambda v: norm(ego_x - v.position[0], ego_y - v.position[1])
+                )
+                for tmp_v in surrounding_vehicles:
+                    obs_parts.append(self.state_observe(tmp_v))
+                if len(surrounding_vehicles) < num_others:
+                    obs_parts.append(np.zeros((num_others - len(surrounding_vehicles)) * self.state_length))
+            obs_parts.append(
+                np.asarray(
+                    self._add_noise_to_cloud_points(
+                        cloud_points,
+                        gaussian_noise=self.config["lidar"]["gaussian_noise"],
+                        dropout_prob=self.config["lidar"]["dropout_prob"]
+                    )
                 )
-                surrounding_vehicles += [None] * num_others
-                for tmp_v in surrounding_vehicles[:num_others]:
-                    if tmp_v is not None:
-                        tmp_v = tmp_v
-                        other_v_info += self.state_observe(tmp_v).tolist()
-                    else:
-                        other_v_info += [0] * self.state_length
-            other_v_info += self._add_noise_to_cloud_points(
-                cloud_points,
-                gaussian_noise=self.config["lidar"]["gaussian_noise"],
-                dropout_prob=self.config["lidar"]["dropout_prob"]
             )
             self.cloud_points = cloud_points
             self.detected_objects = detected_objects
-        return np.concatenate((state, np.asarray(other_v_info)))
+        # the parts may have different dtypes, return the dtype of observation_space whatever the lidar state is
+        return np.concatenate(obs_parts).astype(np.float32)
 
     def state_observe(self, vehicle):
-        return self.state_obs.observe(vehicle)
+        # the env shares the states of vehicles among the observations of all agents in a step
+        shared_states = None if self.env is None else self.env.shared_vehicle_states
+        return self.state_obs.shared_observe(vehicle, shared_states)
 
     def _add_noise_to_cloud_points(self, points, gaussian_noise, dropout_prob):
         if gaussian_noise > 0.0:
@@ -124,10 +132,7 @@ class LidarStateObservationMARound(ObservationBase):
 
 class RoundaboutSpawnManager(SpawnManager):
     def update_destination_for(self, vehicle_id, vehicle_config):
-        end_roads = copy.deepcopy(self.engine.global_config["spawn_roads"])
-        end_road = -self.np_random.choice(end_roads)  # Use negative road!
-        vehicle_config["destination_node"] = end_road.end_node
-        return vehicle_config
+        return self._update_destination_to_spawn_road_exit(vehicle_config)
 
 
 class MultiAgentRoundaboutEnv(MultiAgentPGDrive):
@@ -145,7 +150,7 @@ class MultiAgentRoundaboutEnv(MultiAgentPGDrive):
         )
 
     def get_single_observation(self, vehicle_config: "Config") -> "ObservationBase":
-        return LidarStateObservationMARound(vehicle_config)
+        return LidarStateObservationMARound(vehicle_config, self)
 
     def setup_engine(self):
         from pgdrive.envs.pgdrive_env import PGDriveEnv
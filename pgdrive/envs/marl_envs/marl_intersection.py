@@ -1,4 +1,3 @@
-import copy
 from pgdrive.manager.spawn_manager import SpawnManager
 
 from pgdrive.component.blocks.first_block import FirstPGBlock
@@ -6,7 +5,7 @@ from pgdrive.component.blocks.intersection import InterSection
 from pgdrive.component.map.pg_map import PGMap
 from pgdrive.component.road.road import Road
 from pgdrive.envs.marl_envs.marl_inout_roundabout import LidarStateObservationMARound
-from pgdrive.envs.marl_envs.multi_agent_pgdrive import MultiAgentPGDrive
+from pgdrive.envs.marl_envs.multi_agent_pgdrive import MultiAgentPGDrive, sync_actions, profile_with_random_actions
 from pgdrive.obs.observation_base import ObservationBase
 from pgdrive.utils import get_np_random, Config
 
@@ -55,10 +54,7 @@ class MAIntersectionMap(PGMap):
 
 class InterectionSpawnManager(SpawnManager):
     def update_destination_for(self, agent_id, vehicle_config):
-        end_roads = copy.deepcopy(self.engine.global_config["spawn_roads"])
-        end_road = -self.np_random.choice(end_roads)  # Use negative road!
-        vehicle_config["destination_node"] = end_road.end_node
-        return vehicle_config
+        return self._update_destination_to_spawn_road_exit(vehicle_config)
 
 
 class MultiAgentIntersectionEnv(MultiAgentPGDrive):
@@ -76,7 +72,7 @@ class MultiAgentIntersectionEnv(MultiAgentPGDrive):
         )
 
     def get_single_observation(self, vehicle_config: "Config") -> "ObservationBase":
-        return LidarStateObservationMARound(vehicle_config)
+        return LidarStateObservationMARound(vehicle_config, self)
 
     def setup_engine(self):
         from pgdrive.envs.pgdrive_env import PGDriveEnv
@@ -120,8 +116,7 @@ def _expert():
     ep_s = 0
     for i in range(1, 100000):
         o, r, d, info = env.step(env.action_space.sample())
-        for r_ in r.values():
-            total_r += r_
+        total_r += sum(r.values())
         ep_s += 1
         d.update({"total_r": total_r, "episode length": ep_s})
         # env.render(text=d)
@@ -162,11 +157,10 @@ def _vis_debug_respawn():
     o = env.reset()
     total_r = 0
     ep_s = 0
+    action = {}
     for i in range(1, 100000):
-        action = {k: [0.0, .0] for k in env.vehicles.keys()}
-        o, r, d, info = env.step(action)
-        for r_ in r.values():
-            total_r += r_
+        o, r, d, info = env.step(sync_actions(action, env.vehicles, [0.0, .0]))
+        total_r += sum(r.values())
         ep_s += 1
         # d.update({"total_r": total_r, "episode length": ep_s})
         render_text = {
@@ -215,13 +209,10 @@ def _vis():
     o = env.reset()
     total_r = 0
     ep_s = 0
+    actions = {}
     for i in range(1, 100000):
-        actions = {k: [0.0, 1.0] for k in env.vehicles.keys()}
-        if len(env.vehicles) == 1:
-            actions = {k: [-0, 1.0] for k in env.vehicles.keys()}
-        o, r, d, info = env.step(actions)
-        for r_ in r.values():
-            total_r += r_
+        o, r, d, info = env.step(sync_actions(actions, env.vehicles, [0.0, 1.0]))
+        total_r += sum(r.values())
         ep_s += 1
         # d.update({"total_r": total_r, "episode length": ep_s})
         # render_text = {
@@ -249,27 +240,28 @@ def _vis():
     env.close()
 
 
-def _profile():
-    import time
-    env = MultiAgentIntersectionEnv({"num_agents": 16})
-    obs = env.reset()
-    start = time.time()
-    for s in range(10000):
-        o, r, d, i = env.step(env.action_space.sample())
+def _profile(num_steps=10000, log_interval=100):
+    # keep it headless: no render mode means AssetLoader is not initialized, so no visual models/textures are loaded
+    env = MultiAgentIntersectionEnv({"num_agents": 16, "use_render": False, "offscreen_render": False})
+    return profile_with_random_actions(env, "MAIntersection", num_steps, log_interval)
 
-        # mask_ratio = env.engine.detector_mask.get_mask_ratio()
-        # print("Mask ratio: ", mask_ratio)
 
-        if all(d.values()):
-            env.reset()
-        if (s + 1) % 100 == 0:
-            print(
-                "Finish {}/10000 simulation steps. Time elapse: {:.4f}. Average FPS: {:.4f}".format(
-                    s + 1,
-                    time.time() - start, (s + 1) / (time.time() - start)
-                )
-            )
-    print(f"(MAIntersection) Total Time Elapse: {time.time() - start}")
+def _profile_parallel(num_workers=4, num_steps=10000):
+    """
+    The engine is a singleton in each process, so envs are scaled out by processes. Each worker runs _profile on its
+    own env and only reports back the number of steps when finishing, so no data is exchanged during the simulation.
+    """
+    import multiprocessing
+    import time
+    start = time.time()
+    with multiprocessing.get_context("spawn").Pool(num_workers) as pool:
+        total_steps = sum(pool.starmap(_profile, [(num_steps, None)] * num_workers))
+    print(
+        "(MAIntersection) {} workers finish {} simulation steps. Total Time Elapse: {:.4f}. Average FPS: {:.4f}".format(
+            num_workers, total_steps,
+            time.time() - start, total_steps / (time.time() - start)
+        )
+    )
 
 
 def _long_run():
@@ -355,6 +347,7 @@ if __name__ == "__main__":
     _vis()
     # _vis_debug_respawn()
     # _profiwdle()
+    # _profile_parallel(num_workers=4)
     # _long_run()
     # show_map_and_traj()
     # pygame_replay("parking", MultiAgentParkingLotEnv, False, other_traj="metasvodist_parking_best.json")
@@ -1,4 +1,3 @@
-import copy
 import logging
 
 from pgdrive.component.blocks.first_block import FirstPGBlock
@@ -7,7 +6,7 @@ from pgdrive.component.blocks.t_intersection import TInterSection
 from pgdrive.component.map.pg_map import PGMap
 from pgdrive.component.road.road import Road
 from pgdrive.envs.marl_envs.marl_inout_roundabout import LidarStateObservationMARound
-from pgdrive.envs.marl_envs.multi_agent_pgdrive import MultiAgentPGDrive, panda_replay
+from pgdrive.envs.marl_envs.multi_agent_pgdrive import MultiAgentPGDrive, sync_actions, profile_with_random_actions
 from pgdrive.manager.spawn_manager import SpawnManager
 from pgdrive.obs.observation_base import ObservationBase
 from pgdrive.utils import get_np_random, Config
@@ -35,6 +34,9 @@ MAParkingLotConfig = dict(
     },
 )
 
+# out spawn roads only depend on the number of parking spaces, so they are built once for each parking_space_num
+_OUT_SPAWN_ROADS_CACHE = {}
+
 from pgdrive.manager.spawn_manager import SpawnManager
 
 
@@ -46,42 +48,58 @@ class ParkingLotSpawnManager(SpawnManager):
     """
     def __init__(self):
         super(ParkingLotSpawnManager, self).__init__()
+        # roads are hashed by an interned integer id, so this set is as cheap to query as a bitmask of space ids
         self.parking_space_available = set()
+        # same items as parking_space_available, kept in a list for sampling without converting the set every time
+        self._parking_space_list = []
         self._parking_spaces = None
         self.v_dest_pair = {}
+        # in_spawn_roads don't change during the lifetime of the env, build a set for O(1) membership test
+        self.in_spawn_roads = frozenset(self.engine.global_config["in_spawn_roads"])
+        self._in_spawn_roads_tuple = tuple(self.engine.global_config["in_spawn_roads"])
+
+    def _reset_parking_spaces(self):
+        self._parking_spaces = self.engine.map_manager.current_map.parking_space
+        self.v_dest_pair = {}
+        self.parking_space_available = set(self._parking_spaces)
+        self._parking_space_list = list(self.parking_space_available)
 
     def get_parking_space(self, v_id):
         if self._parking_spaces is None:
-            self._parking_spaces = self.engine.map_manager.current_map.parking_space
-            self.v_dest_pair = {}
-            self.parking_space_available = set(copy.deepcopy(self._parking_spaces))
-        parking_space_idx = self.np_random.choice([i for i in range(len(self.parking_space_available))])
-        parking_space = list(self.parking_space_available)[parking_space_idx]
+            self._reset_parking_spaces()
+        parking_space_idx = self.np_random.randint(len(self._parking_space_list))
+        parking_space = self._parking_space_list[parking_space_idx]
+        # swap with the last one and pop, so that the removal is O(1)
+        last = self._parking_space_list.pop()
+        if parking_space_idx < len(self._parking_space_list):
+            self._parking_space_list[parking_space_idx] = last
         self.parking_space_available.remove(parking_space)
         self.v_dest_pair[v_id] = parking_space
         return parking_space
 
     def add_available_parking_space(self, parking_space: Road):
-        self.parking_space_available.add(parking_space)
+        if parking_space not in self.parking_space_available:
+            self.parking_space_available.add(parking_space)
+            self._parking_space_list.append(parking_space)
 
     def after_vehicle_done(self, v_id):
         if v_id in self.v_dest_pair:
             dest = self.v_dest_pair.pop(v_id)
-            self.parking_space_available.add(dest)
+            self.add_available_parking_space(dest)
 
     def reset(self):
-        self._parking_spaces = self.engine.map_manager.current_map.parking_space
-        self.v_dest_pair = {}
-        self.parking_space_available = set(copy.deepcopy(self._parking_spaces))
+        # The single-block map and the spawn places are built once and reused by all episodes, so only the parking
+        # space assignment and the spawn points of agents are refreshed here
+        self._reset_parking_spaces()
         super(ParkingLotSpawnManager, self).reset()
 
     def update_destination_for(self, vehicle_id, vehicle_config):
         # when agent re-joined to the game, call this to set the new route to destination
-        end_roads = copy.deepcopy(self.engine.global_config["in_spawn_roads"])
-        if Road(*vehicle_config["spawn_lane_index"][:-1]) in end_roads:
+        if Road(*vehicle_config["spawn_lane_index"][:-1]) in self.in_spawn_roads:
             end_road = self.engine.spawn_manager.get_parking_space(vehicle_id)
         else:
-            end_road = -self.np_random.choice(end_roads)  # Use negative road!
+            end_roads = self._in_spawn_roads_tuple
+            end_road = -end_roads[self.np_random.randint(len(end_roads))]  # Use negative road!
         vehicle_config["destination_node"] = end_road.end_node
         return vehicle_config
 
@@ -111,21 +129,36 @@ class MAParkingLotMap(PGMap):
         self.blocks.append(last_block)
         self.parking_space = last_block.dest_roads
         self.parking_lot = last_block
+        # in-direction parking space -> out-direction one, which is used for respawning vehicles in parking spaces
+        self.out_direction_parking_space = {
+            road: ParkingLot.out_direction_parking_space(road)
+            for road in last_block.dest_roads
+        }
 
         # Build ParkingLot
+        # Only this T-intersection has a short exit part. The class attribute is restored after constructing it, so that
+        # the T-intersections built later in this process are not affected
+        exit_part_length = vars(TInterSection).get("EXIT_PART_LENGTH")
         TInterSection.EXIT_PART_LENGTH = 10
-        last_block = TInterSection(
-            2, last_block.get_socket(index=0), self.road_network, random_seed=1, ignore_intersection_checking=False
-        )
-        last_block.construct_block(
-            parent_node_path,
-            physics_world,
-            extra_config={
-                "t_type": 1,
-                "change_lane_num": 0
-                # Note: lane_num is set in config.map_config.lane_num
-            }
-        )
+        try:
+            last_block = TInterSection(
+                2, last_block.get_socket(index=0), self.road_network, random_seed=1, ignore_intersection_checking=False
+            )
+            last_block.construct_block(
+                parent_node_path,
+                physics_world,
+                extra_config={
+                    "t_type": 1,
+                    "change_lane_num": 0
+                    # Note: lane_num is set in config.map_config.lane_num
+                }
+            )
+        finally:
+            if exit_part_length is None:
+                # inherited from InterSection before
+                del TInterSection.EXIT_PART_LENGTH
+            else:
+                TInterSection.EXIT_PART_LENGTH = exit_part_length
         self.blocks.append(last_block)
 
 
@@ -133,16 +166,27 @@ class MultiAgentParkingLotEnv(MultiAgentPGDrive):
     """
     Env will be done when vehicle is on yellow or white continuous lane line!
     """
+    # created once and shared by all respawns when _DEBUG_RANDOM_SEED is not set
+    _respawn_np_random = None
+
+    def __init__(self, config: dict = None):
+        super(MultiAgentParkingLotEnv, self).__init__(config)
+        # scratch dict of _respawn_single_vehicle, it is cleared and refilled in each call
+        self._filtered_spawn_places = {}
+
     @staticmethod
     def default_config() -> Config:
         return MultiAgentPGDrive.default_config().update(MAParkingLotConfig, allow_add_new_key=True)
 
     @staticmethod
     def _get_out_spawn_roads(parking_space_num):
-        ret = []
-        for i in range(1, parking_space_num + 1):
-            ret.append(Road(ParkingLot.node(1, i, 5), ParkingLot.node(1, i, 6)))
-        return ret
+        cached = _OUT_SPAWN_ROADS_CACHE.get(parking_space_num)
+        if cached is None:
+            cached = tuple(
+                Road(ParkingLot.node(1, i, 5), ParkingLot.node(1, i, 6)) for i in range(1, parking_space_num + 1)
+            )
+            _OUT_SPAWN_ROADS_CACHE[parking_space_num] = cached
+        return list(cached)
 
     def _merge_extra_config(self, config) -> "Config":
         ret_config = super(MultiAgentParkingLotEnv, self)._merge_extra_config(config)
@@ -168,24 +212,31 @@ class MultiAgentParkingLotEnv(MultiAgentPGDrive):
         """
         Exclude destination parking space
         """
-        safe_places_dict = self.engine.spawn_manager.get_available_respawn_places(
-            self.current_map, randomize=randomize_position
-        )
+        spawn_manager = self.engine.spawn_manager
+        parking_space_available = spawn_manager.parking_space_available
+        if len(parking_space_available) == 0:
+            # Every spawn place needs a free parking space, either as its destination or to spawn in. Bail out before
+            # running the region detection for all spawn places
+            return None, None
+        safe_places_dict = spawn_manager.get_available_respawn_places(self.current_map, randomize=randomize_position)
         # ===== filter spawn places =====
-        filter_ret = {}
+        in_spawn_roads = spawn_manager.in_spawn_roads
+        out_direction_parking_space = self.current_map.out_direction_parking_space
+        filter_ret = self._filtered_spawn_places
+        filter_ret.clear()
         for id, config in safe_places_dict.items():
-            spawn_l_index = config["config"]["spawn_lane_index"]
-            spawn_road = Road(spawn_l_index[0], spawn_l_index[1])
-            if spawn_road in self.config["in_spawn_roads"]:
-                if len(self.engine.spawn_manager.parking_space_available) > 0:
-                    filter_ret[id] = config
+            spawn_road = config["spawn_road"]
+            if spawn_road in in_spawn_roads:
+                filter_ret[id] = config
             else:
                 # spawn in parking space
-                if ParkingLot.is_in_direction_parking_space(spawn_road):
+                out_direction_road = out_direction_parking_space.get(spawn_road)
+                if out_direction_road is not None:
                     # avoid sweep test bug
-                    spawn_road = self.current_map.parking_lot.out_direction_parking_space(spawn_road)
+                    spawn_road = out_direction_road
                     config["config"]["spawn_lane_index"] = (spawn_road.start_node, spawn_road.end_node, 0)
-                if spawn_road in self.engine.spawn_manager.parking_space_available:
+                    config["spawn_road"] = spawn_road
+                if spawn_road in parking_space_available:
                     # not other vehicle's destination
                     filter_ret[id] = config
 
@@ -195,7 +246,9 @@ class MultiAgentParkingLotEnv(MultiAgentPGDrive):
             # No more run, just wait!
             return None, None
         assert len(safe_places_dict) > 0
-        bp_index = get_np_random(self._DEBUG_RANDOM_SEED).choice(list(safe_places_dict.keys()), 1)[0]
+        # pick by index, instead of letting numpy convert the keys to an object array. The picked place is the same
+        safe_places = tuple(safe_places_dict)
+        bp_index = safe_places[self._get_respawn_np_random().randint(len(safe_places))]
         new_spawn_place = safe_places_dict[bp_index]
 
         new_agent_id, vehicle = self.agent_manager.propose_new_vehicle()
@@ -209,8 +262,16 @@ class MultiAgentParkingLotEnv(MultiAgentPGDrive):
         new_obs = self.observations[new_agent_id].observe(vehicle)
         return new_agent_id, new_obs
 
+    def _get_respawn_np_random(self):
+        if self._DEBUG_RANDOM_SEED is not None:
+            # a fresh generator from the debug seed each time, so that the same respawn place is picked as before
+            return get_np_random(self._DEBUG_RANDOM_SEED)
+        if self._respawn_np_random is None:
+            self._respawn_np_random = get_np_random()
+        return self._respawn_np_random
+
     def get_single_observation(self, vehicle_config: "Config") -> "ObservationBase":
-        return LidarStateObservationMARound(vehicle_config)
+        return LidarStateObservationMARound(vehicle_config, self)
 
     def done_function(self, vehicle_id):
         done, info = super(MultiAgentParkingLotEnv, self).done_function(vehicle_id)
@@ -220,6 +281,7 @@ class MultiAgentParkingLotEnv(MultiAgentPGDrive):
 
     def _is_out_of_road(self, vehicle):
         # A specified function to determine whether this vehicle should be done.
+        # These flags are plain attributes, which are filled by one contact test in BaseVehicle._state_check each step
         return vehicle.on_yellow_continuous_line or (not vehicle.on_lane) or vehicle.crash_sidewalk
         # ret = vehicle.out_of_route
         # return ret
@@ -266,8 +328,7 @@ def _expert():
     ep_s = 0
     for i in range(1, 100000):
         o, r, d, info = env.step(env.action_space.sample())
-        for r_ in r.values():
-            total_r += r_
+        total_r += sum(r.values())
         ep_s += 1
         d.update({"total_r": total_r, "episode length": ep_s})
         # env.render(text=d)
@@ -308,11 +369,10 @@ def _vis_debug_respawn():
     o = env.reset()
     total_r = 0
     ep_s = 0
+    action = {}
     for i in range(1, 100000):
-        action = {k: [0.0, .0] for k in env.vehicles.keys()}
-        o, r, d, info = env.step(action)
-        for r_ in r.values():
-            total_r += r_
+        o, r, d, info = env.step(sync_actions(action, env.vehicles, [0.0, .0]))
+        total_r += sum(r.values())
         ep_s += 1
         # d.update({"total_r": total_r, "episode length": ep_s})
         render_text = {
@@ -364,13 +424,13 @@ def _vis():
     o = env.reset()
     total_r = 0
     ep_s = 0
+    forward_actions = {}
     for i in range(1, 100000):
-        actions = {k: [1.0, .0] for k in env.vehicles.keys()}
+        actions = sync_actions(forward_actions, env.vehicles, [1.0, .0])
         if len(env.vehicles) == 1:
             actions = {k: [-1.0, .0] for k in env.vehicles.keys()}
         o, r, d, info = env.step(actions)
-        for r_ in r.values():
-            total_r += r_
+        total_r += sum(r.values())
         ep_s += 1
         # d.update({"total_r": total_r, "episode length": ep_s})
         if len(env.vehicles) != 0:
@@ -426,26 +486,8 @@ def _vis():
 
 
 def _profile():
-    import time
     env = MultiAgentParkingLotEnv({"num_agents": 10})
-    obs = env.reset()
-    start = time.time()
-    for s in range(10000):
-        o, r, d, i = env.step(env.action_space.sample())
-
-        # mask_ratio = env.engine.detector_mask.get_mask_ratio()
-        # print("Mask ratio: ", mask_ratio)
-
-        if all(d.values()):
-            env.reset()
-        if (s + 1) % 100 == 0:
-            print(
-                "Finish {}/10000 simulation steps. Time elapse: {:.4f}. Average FPS: {:.4f}".format(
-                    s + 1,
-                    time.time() - start, (s + 1) / (time.time() - start)
-                )
-            )
-    print(f"(MAParkingLot) Total Time Elapse: {time.time() - start}")
+    profile_with_random_actions(env, "MAParkingLot")
 
 
 def _long_run():
@@ -510,6 +552,7 @@ if __name__ == "__main__":
     # _vis_debug_respawn()
     # _profile()
     # _long_run()
+    # from pgdrive.envs.marl_envs.multi_agent_pgdrive import pygame_replay, panda_replay
     # pygame_replay("parking", MultiAgentParkingLotEnv, False, other_traj="metasvodist_parking_best.json")
     # panda_replay(
     #     "parking",
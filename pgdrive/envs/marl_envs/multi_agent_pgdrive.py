@@ -1,5 +1,6 @@
 import copy
 import logging
+from contextlib import contextmanager
 
 from pgdrive.component.blocks.first_block import FirstPGBlock
 from pgdrive.component.road.road import Road
@@ -69,6 +70,11 @@ class MultiAgentPGDrive(PGDriveEnv):
         config.update(MULTI_AGENT_PGDRIVE_DEFAULT_CONFIG)
         return config
 
+    def __init__(self, config: dict = None):
+        super(MultiAgentPGDrive, self).__init__(config)
+        # vehicle name -> state, only available in _share_vehicle_states()
+        self.shared_vehicle_states = None
+
     def _merge_extra_config(self, config) -> "Config":
         ret_config = self.default_config().update(
             config, allow_add_new_key=False, stop_recursive_update=["target_vehicle_configs"]
@@ -149,6 +155,28 @@ class MultiAgentPGDrive(PGDriveEnv):
 
         return o, r, d, i
 
+    @contextmanager
+    def _share_vehicle_states(self):
+        """
+        Vehicles don't move in this context, so the state of each vehicle is only computed once and reused by all
+        observations. It is used when observing all agents of a step, where the state of a vehicle is also part of the
+        observation of its neighbours.
+        """
+        previous_states = self.shared_vehicle_states
+        self.shared_vehicle_states = {}
+        try:
+            yield
+        finally:
+            self.shared_vehicle_states = previous_states
+
+    def _get_reset_return(self):
+        with self._share_vehicle_states():
+            return super(MultiAgentPGDrive, self)._get_reset_return()
+
+    def _get_step_return(self, actions, step_infos):
+        with self._share_vehicle_states():
+            return super(MultiAgentPGDrive, self)._get_step_return(actions, step_infos)
+
     def _after_vehicle_done(self, obs=None, reward=None, dones: dict = None, info=None):
         if self.engine.replay_system is not None:
             return obs, reward, dones, info
@@ -280,6 +308,56 @@ def _vis():
     env.close()
 
 
+def sync_actions(actions, vehicles, action):
+    """
+    Keep a persistent action dict in sync with the active vehicles, instead of rebuilding it in every step.
+    The same action object is shared by all vehicles, so it should not be modified in place
+    """
+    if actions.keys() != vehicles.keys():
+        for agent_id in actions.keys() - vehicles.keys():
+            actions.pop(agent_id)
+        for agent_id in vehicles.keys() - actions.keys():
+            actions[agent_id] = action
+    return actions
+
+
+def profile_with_random_actions(env, name, num_steps=10000, log_interval=100):
+    """
+    Step a multi-agent env with random actions and report the FPS, then close the env. All actions are sampled in
+    advance, so that the FPS reflects the simulation instead of building and sampling action spaces
+    """
+    import time
+    import numpy as np
+    env.reset()
+    single_action_space = next(iter(env.action_space.spaces.values()))
+    action_pool = np.random.uniform(
+        single_action_space.low, single_action_space.high, size=(num_steps, env.num_agents) + single_action_space.shape
+    ).astype(single_action_space.dtype)
+    actions = {}
+    start = time.time()
+    for s in range(num_steps):
+        actions.clear()
+        for agent_index, agent_id in enumerate(env.vehicles):
+            actions[agent_id] = action_pool[s, agent_index]
+        o, r, d, i = env.step(actions)
+
+        # mask_ratio = env.engine.detector_mask.get_mask_ratio()
+        # print("Mask ratio: ", mask_ratio)
+
+        if all(d.values()):
+            env.reset()
+        if log_interval and (s + 1) % log_interval == 0:
+            print(
+                "Finish {}/{} simulation steps. Time elapse: {:.4f}. Average FPS: {:.4f}".format(
+                    s + 1, num_steps,
+                    time.time() - start, (s + 1) / (time.time() - start)
+                )
+            )
+    print(f"({name}) Total Time Elapse: {time.time() - start}")
+    env.close()
+    return num_steps
+
+
 def pygame_replay(name, env_class, save=False, other_traj=None, film_size=(1000, 1000), extra_config={}):
     import copy
     import json
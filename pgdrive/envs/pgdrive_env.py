@@ -1,4 +1,3 @@
-import copy
 import logging
 import os.path as osp
 from typing import Union, Dict, AnyStr, Tuple
@@ -15,6 +14,8 @@ from pgdrive.obs.image_obs import ImageStateObservation
 from pgdrive.obs.state_obs import LidarStateObservation
 from pgdrive.utils import clip, Config, concat_step_infos, get_np_random
 
+logger = logging.getLogger(__name__)
+
 pregenerated_map_file = osp.join(
     osp.dirname(osp.dirname(osp.abspath(__file__))), "assets", "maps",
     "20210814_generated_maps_start_seed_0_environment_num_30000.json"
@@ -108,6 +109,15 @@ PGDriveEnv_DEFAULT_CONFIG = dict(
     out_of_route_done=False,
 )
 
+# copied for every done_function call, which is cheaper than building the dict from keywords
+_DONE_INFO_TEMPLATE = {
+    TerminationState.CRASH_VEHICLE: False,
+    TerminationState.CRASH_OBJECT: False,
+    TerminationState.CRASH_BUILDING: False,
+    TerminationState.OUT_OF_ROAD: False,
+    TerminationState.SUCCESS: False
+}
+
 
 class PGDriveEnv(BasePGDriveEnv):
     @classmethod
@@ -140,20 +150,13 @@ class PGDriveEnv(BasePGDriveEnv):
         )
         config["vehicle_config"]["rgb_clip"] = config["rgb_clip"]
         config["vehicle_config"]["random_agent_model"] = config["random_agent_model"]
-        if config.get("gaussian_noise", 0) > 0:
-            assert config["vehicle_config"]["lidar"]["gaussian_noise"] == 0, "You already provide config!"
-            assert config["vehicle_config"]["side_detector"]["gaussian_noise"] == 0, "You already provide config!"
-            assert config["vehicle_config"]["lane_line_detector"]["gaussian_noise"] == 0, "You already provide config!"
-            config["vehicle_config"]["lidar"]["gaussian_noise"] = config["gaussian_noise"]
-            config["vehicle_config"]["side_detector"]["gaussian_noise"] = config["gaussian_noise"]
-            config["vehicle_config"]["lane_line_detector"]["gaussian_noise"] = config["gaussian_noise"]
-        if config.get("dropout_prob", 0) > 0:
-            assert config["vehicle_config"]["lidar"]["dropout_prob"] == 0, "You already provide config!"
-            assert config["vehicle_config"]["side_detector"]["dropout_prob"] == 0, "You already provide config!"
-            assert config["vehicle_config"]["lane_line_detector"]["dropout_prob"] == 0, "You already provide config!"
-            config["vehicle_config"]["lidar"]["dropout_prob"] = config["dropout_prob"]
-            config["vehicle_config"]["side_detector"]["dropout_prob"] = config["dropout_prob"]
-            config["vehicle_config"]["lane_line_detector"]["dropout_prob"] = config["dropout_prob"]
+        vehicle_config = config["vehicle_config"]
+        for noise_key in ("gaussian_noise", "dropout_prob"):
+            noise = config.get(noise_key, 0)
+            if noise > 0:
+                for sensor in ("lidar", "side_detector", "lane_line_detector"):
+                    assert vehicle_config[sensor][noise_key] == 0, "You already provide config!"
+                    vehicle_config[sensor][noise_key] = noise
         return config
 
     def _get_observations(self):
@@ -162,29 +165,27 @@ class PGDriveEnv(BasePGDriveEnv):
     def done_function(self, vehicle_id: str):
         vehicle = self.vehicles[vehicle_id]
         done = False
-        done_info = dict(
-            crash_vehicle=False, crash_object=False, crash_building=False, out_of_road=False, arrive_dest=False
-        )
+        done_info = _DONE_INFO_TEMPLATE.copy()
         if vehicle.arrive_destination:
             done = True
-            logging.info("Episode ended! Reason: arrive_dest.")
+            logger.info("Episode ended! Reason: arrive_dest.")
             done_info[TerminationState.SUCCESS] = True
         if self._is_out_of_road(vehicle):
             done = True
-            logging.info("Episode ended! Reason: out_of_road.")
+            logger.info("Episode ended! Reason: out_of_road.")
             done_info[TerminationState.OUT_OF_ROAD] = True
         if vehicle.crash_vehicle:
             done = True
-            logging.info("Episode ended! Reason: crash vehicle ")
+            logger.info("Episode ended! Reason: crash vehicle ")
             done_info[TerminationState.CRASH_VEHICLE] = True
         if vehicle.crash_object:
             done = True
             done_info[TerminationState.CRASH_OBJECT] = True
-            logging.info("Episode ended! Reason: crash object ")
+            logger.info("Episode ended! Reason: crash object ")
         if vehicle.crash_building:
             done = True
             done_info[TerminationState.CRASH_BUILDING] = True
-            logging.info("Episode ended! Reason: crash building ")
+            logger.info("Episode ended! Reason: crash building ")
 
         # for compatibility
         # crash almost equals to crashing with vehicles
@@ -196,8 +197,7 @@ class PGDriveEnv(BasePGDriveEnv):
 
     def cost_function(self, vehicle_id: str):
         vehicle = self.vehicles[vehicle_id]
-        step_info = dict()
-        step_info["cost"] = 0
+        step_info = {"cost": 0}
         if self._is_out_of_road(vehicle):
             step_info["cost"] = self.config["out_of_road_cost"]
         elif vehicle.crash_vehicle:
@@ -208,6 +208,9 @@ class PGDriveEnv(BasePGDriveEnv):
 
     def _is_out_of_road(self, vehicle):
         # A specified function to determine whether this vehicle should be done.
+        # It is called by done, reward and cost functions in each step, which is cheap since it only reads the flags
+        # updated once in vehicle.after_step(). These flags already act as the per-step cache, so the order of the
+        # checks below does not matter for speed
         # return vehicle.on_yellow_continuous_line or (not vehicle.on_lane) or vehicle.crash_sidewalk
         ret = vehicle.on_yellow_continuous_line or vehicle.on_white_continuous_line or \
               (not vehicle.on_lane) or vehicle.crash_sidewalk
@@ -222,39 +225,41 @@ class PGDriveEnv(BasePGDriveEnv):
         :return: reward
         """
         vehicle = self.vehicles[vehicle_id]
+        navigation = vehicle.navigation
+        config = self.config
         step_info = dict()
 
         # Reward for moving forward in current lane
-        if vehicle.lane in vehicle.navigation.current_ref_lanes:
+        if vehicle.lane in navigation.current_ref_lanes:
             current_lane = vehicle.lane
             positive_road = 1
         else:
-            current_lane = vehicle.navigation.current_ref_lanes[0]
+            current_lane = navigation.current_ref_lanes[0]
             current_road = vehicle.current_road
             positive_road = 1 if not current_road.is_negative_road() else -1
         long_last, _ = current_lane.local_coordinates(vehicle.last_position)
         long_now, lateral_now = current_lane.local_coordinates(vehicle.position)
 
         # reward for lane keeping, without it vehicle can learn to overtake but fail to keep in lane
-        if self.config["use_lateral"]:
-            lateral_factor = clip(1 - 2 * abs(lateral_now) / vehicle.navigation.get_current_lane_width(), 0.0, 1.0)
+        if config["use_lateral"]:
+            lateral_factor = clip(1 - 2 * abs(lateral_now) / navigation.get_current_lane_width(), 0.0, 1.0)
         else:
             lateral_factor = 1.0
 
         reward = 0.0
-        reward += self.config["driving_reward"] * (long_now - long_last) * lateral_factor * positive_road
-        reward += self.config["speed_reward"] * (vehicle.speed / vehicle.max_speed) * positive_road
+        reward += config["driving_reward"] * (long_now - long_last) * lateral_factor * positive_road
+        reward += config["speed_reward"] * (vehicle.speed / vehicle.max_speed) * positive_road
 
         step_info["step_reward"] = reward
 
         if vehicle.arrive_destination:
-            reward = +self.config["success_reward"]
+            reward = +config["success_reward"]
         elif self._is_out_of_road(vehicle):
-            reward = -self.config["out_of_road_penalty"]
+            reward = -config["out_of_road_penalty"]
         elif vehicle.crash_vehicle:
-            reward = -self.config["crash_vehicle_penalty"]
+            reward = -config["crash_vehicle_penalty"]
         elif vehicle.crash_object:
-            reward = -self.config["crash_object_penalty"]
+            reward = -config["crash_object_penalty"]
         return reward, step_info
 
     def dump_all_maps(self):
@@ -279,12 +284,13 @@ class PGDriveEnv(BasePGDriveEnv):
             # self.engine.map_manager.unload_map(new_map)
             print("Finish generating map with seed: {}".format(seed))
 
+        # save_map() already returns a deep copy of each map's data, so it doesn't have to be copied again
         map_data = dict()
         for seed, map in self.maps.items():
             assert map is not None
             map_data[seed] = map.save_map()
 
-        return_data = dict(map_config=self.config["map_config"].copy().get_dict(), map_data=copy.deepcopy(map_data))
+        return_data = dict(map_config=self.config["map_config"].copy().get_dict(), map_data=map_data)
         return return_data
 
     def toggle_expert_takeover(self):
@@ -305,12 +311,17 @@ class PGDriveEnv(BasePGDriveEnv):
             if self.main_camera.is_bird_view_camera():
                 current_track_vehicle = self.current_track_vehicle
             else:
-                vehicles = list(self.agent_manager.active_agents.values())
+                vehicles = list(self.agent_manager.active_objects.values())
                 if len(vehicles) <= 1:
                     return
+                # Draw an index instead of calling choice() on the list, which converts it to an object array
                 if self.current_track_vehicle in vehicles:
-                    vehicles.remove(self.current_track_vehicle)
-                new_v = get_np_random().choice(vehicles)
+                    current_index = vehicles.index(self.current_track_vehicle)
+                    index = get_np_random().randint(len(vehicles) - 1)
+                    index = index + 1 if index >= current_index else index
+                else:
+                    index = get_np_random().randint(len(vehicles))
+                new_v = vehicles[index]
                 current_track_vehicle = new_v
         self.main_camera.track(current_track_vehicle)
         return
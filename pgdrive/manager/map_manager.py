@@ -1,4 +1,5 @@
 import copy
+import functools
 import json
 import logging
 import os.path as osp
@@ -9,6 +10,16 @@ from pgdrive.manager.base_manager import BaseManager
 from pgdrive.utils import recursive_equal
 
 
+@functools.lru_cache(maxsize=1)
+def _load_maps_json(path):
+    """
+    Parse the pre-generated maps file once per process, since every new engine reads it again at the first reset.
+    The returned dict is shared, so it should never be modified. It is deep copied when building each map's config
+    """
+    with open(path, "r") as f:
+        return json.load(f)
+
+
 class MapManager(BaseManager):
     """
     MapManager contains a list of maps
@@ -43,8 +54,7 @@ class MapManager(BaseManager):
     def read_all_maps_from_json(self, path):
         assert path.endswith(".json")
         assert osp.isfile(path), path
-        with open(path, "r") as f:
-            config_and_data = json.load(f)
+        config_and_data = _load_maps_json(path)
         global_config = self.engine.global_config
         start_seed = global_config["start_seed"]
         env_num = global_config["environment_num"]
@@ -115,6 +125,8 @@ class MapManager(BaseManager):
         if config["is_multi_agent"] and single_block_class is not None:
             assert single_block_class is not None
             assert spawn_roads is not None
+            # The single block map only depends on the env config, so it is built at the first reset and reused by
+            # all following resets of this engine
             if self.current_map is None:
                 new_map = self.spawn_object(single_block_class, map_config=config["map_config"], random_seed=None)
                 self.load_map(new_map)
@@ -131,6 +143,8 @@ class MapManager(BaseManager):
         if self.current_map is not None:
             self.unload_map(self.current_map)
 
+        # Maps are built on the first visit of each seed and reused afterwards. They are not prefetched in a background
+        # thread, because building a map creates Panda3D nodes and Bullet bodies, which must stay on the main thread
         if self.pg_maps[current_seed] is None:
             if config["load_map_from_json"]:
                 map_config = self.restored_pg_map_configs.get(current_seed, None)
@@ -59,6 +59,9 @@ class SpawnManager(BaseManager):
         self.safe_spawn_places = {place["identifier"]: place for place in safe_spawn_places}
         self.spawn_roads = spawn_roads
         self.need_update_spawn_places = True
+        # spawn roads don't change during the lifetime of the env, so the destinations are only built once.
+        # Use negative road!
+        self._spawn_road_exit_nodes = tuple((-road).end_node for road in spawn_roads)
 
     @staticmethod
     def get_not_randomize_vehicle_configs(configs):
@@ -141,6 +144,7 @@ class SpawnManager(BaseManager):
                         Config(
                             dict(
                                 identifier="|".join((str(s) for s in lane_tuple + (j, ))),
+                                spawn_road=road,
                                 config={
                                     "spawn_lane_index": lane_tuple,
                                     "spawn_longitude": long,
@@ -223,3 +227,11 @@ class SpawnManager(BaseManager):
         Choose a destination for agent
         """
         return vehicle_config
+
+    def _update_destination_to_spawn_road_exit(self, vehicle_config):
+        """
+        Choose the opposite road of a random spawn road as destination, for maps whose entries are also exits
+        """
+        exit_nodes = self._spawn_road_exit_nodes
+        vehicle_config["destination_node"] = exit_nodes[self.np_random.randint(len(exit_nodes))]
+        return vehicle_config
@@ -13,6 +13,23 @@ class StateObservation(ObservationBase):
     """
     def __init__(self, config):
         super(StateObservation, self).__init__(config)
+        # states are only shared among observations whose config entries used by observe() are the same
+        self._shared_state_key = (
+            type(self), self.config["random_agent_model"], self.config["side_detector"]["num_lasers"],
+            self.config["lane_line_detector"]["num_lasers"]
+        )
+
+    def shared_observe(self, vehicle, shared_states: dict = None):
+        """
+        Same as observe(), but reuse the state of this vehicle if it is already computed and stored in shared_states
+        """
+        if shared_states is None:
+            return self.observe(vehicle)
+        key = (self._shared_state_key, vehicle.name)
+        state = shared_states.get(key)
+        if state is None:
+            state = shared_states[key] = self.observe(vehicle)
+        return state
 
     @property
     def observation_space(self):
@@ -226,5 +226,5 @@ class TopDownObservation(ObservationBase):
         if self.rgb_clip:
             img = img.astype(np.float32) / 255
         else:
-            img = img.astype(np.uint8)
+            img = img.astype(np.uint8, copy=False)
         return np.transpose(img, (1, 0, 2))
@@ -371,31 +371,12 @@ class LaneGraphics:
         from pgdrive.component.blocks.pg_block import PGBlock
         segment_num = int(lane.length / PGBlock.CIRCULAR_SEGMENT_LENGTH)
         width = lane.width
-        for segment in range(segment_num):
-            p_1 = lane.position(segment * PGBlock.CIRCULAR_SEGMENT_LENGTH, -width / 2)
-            p_2 = lane.position(segment * PGBlock.CIRCULAR_SEGMENT_LENGTH, width / 2)
-            p_3 = lane.position((segment + 1) * PGBlock.CIRCULAR_SEGMENT_LENGTH, width / 2)
-            p_4 = lane.position((segment + 1) * PGBlock.CIRCULAR_SEGMENT_LENGTH, -width / 2)
-            pygame.draw.polygon(
-                surface, color,
-                [surface.pos2pix(*p_1),
-                 surface.pos2pix(*p_2),
-                 surface.pos2pix(*p_3),
-                 surface.pos2pix(*p_4)]
-            )
-
-        # # for last part
-        p_1 = lane.position(segment_num * PGBlock.CIRCULAR_SEGMENT_LENGTH, -width / 2)
-        p_2 = lane.position(segment_num * PGBlock.CIRCULAR_SEGMENT_LENGTH, width / 2)
-        p_3 = lane.position(lane.length, width / 2)
-        p_4 = lane.position(lane.length, -width / 2)
-        pygame.draw.polygon(
-            surface, color,
-            [surface.pos2pix(*p_1),
-             surface.pos2pix(*p_2),
-             surface.pos2pix(*p_3),
-             surface.pos2pix(*p_4)]
-        )
+        longitudes = [segment * PGBlock.CIRCULAR_SEGMENT_LENGTH for segment in range(segment_num + 1)] + [lane.length]
+        # adjacent segments share their boundary, so each boundary point is only computed once
+        left = [surface.pos2pix(*lane.position(longitude, -width / 2)) for longitude in longitudes]
+        right = [surface.pos2pix(*lane.position(longitude, width / 2)) for longitude in longitudes]
+        for i in range(len(longitudes) - 1):
+            pygame.draw.polygon(surface, color, [left[i], right[i], right[i + 1], left[i + 1]])
 
 
 class ObservationWindowMultiChannel:
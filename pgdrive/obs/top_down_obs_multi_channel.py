@@ -228,14 +228,6 @@ class TopDownMultiChannel(TopDownObservation):
             self._should_fill_stack = False
         self.stack_traffic_flow.append(img_dict["traffic_flow"])
 
-        img = [
-            img_dict["road_network"] * 2,
-            # img_navigation,
-            # img_dict["navigation"],
-            # img_dict["target_vehicle"],
-            img_dict["past_pos"],
-        ]  # + list(self.stack_traffic_flow)
-
         # Stacked traffic flow
         # stacked = np.zeros_like(img_navigation)
         indices = self._get_stack_indices(len(self.stack_traffic_flow))
@@ -245,15 +237,18 @@ class TopDownMultiChannel(TopDownObservation):
         #     stacked = np.clip(stacked, 0.0, 1.0)
         # else:
         #     stacked = np.clip(stacked, 0, 255)
-        for i in indices:
-            img.append(self.stack_traffic_flow[i])
 
-        # Stack
-        img = np.stack(img, axis=2)
+        # Stack, by writing each channel into one array instead of np.stack() and np.clip() copying all of them.
+        # It is allocated per step, since the returned observation may be kept by the caller
+        road_network = img_dict["road_network"]
+        img = np.empty(road_network.shape + (2 + len(indices), ), dtype=road_network.dtype)
+        np.multiply(road_network, 2, out=img[..., 0])
+        img[..., 1] = img_dict["past_pos"]
+        for channel, i in enumerate(indices, 2):
+            img[..., channel] = self.stack_traffic_flow[i]
+        # With rgb_clip=False the channels are already uint8, which can not leave [0, 255], so only floats are clipped
         if self.rgb_clip:
-            img = np.clip(img, 0, 1.0)
-        else:
-            img = np.clip(img, 0, 255)
+            np.clip(img, 0, 1.0, out=img)
         return np.transpose(img, (1, 0, 2))
 
     def draw_navigation(self, canvas, color=(128, 128, 128)):
@@ -1,4 +1,5 @@
 import logging
+import math
 
 import numpy as np
 
@@ -252,22 +253,26 @@ class IDMPolicy(BasePolicy):
         return float(steering)
 
     def acceleration(self, front_obj, dist_to_front) -> float:
+        # This scalar IDM formula runs once per traffic vehicle per step, so the vehicle speed, which queries the
+        # physics body, is read only once and the math is done on Python floats instead of NumPy scalars
         ego_vehicle = self.control_object
+        ego_speed = ego_vehicle.speed
         ego_target_speed = not_zero(self.target_speed, 0)
-        acceleration = self.ACC_FACTOR * (1 - np.power(max(ego_vehicle.speed, 0) / ego_target_speed, self.DELTA))
+        acceleration = self.ACC_FACTOR * (1 - (max(ego_speed, 0) / ego_target_speed)**self.DELTA)
         if front_obj:
             d = dist_to_front
-            speed_diff = self.desired_gap(ego_vehicle, front_obj) / not_zero(d)
+            speed_diff = self.desired_gap(ego_vehicle, front_obj, ego_speed=ego_speed) / not_zero(d)
             acceleration -= self.ACC_FACTOR * (speed_diff**2)
         return acceleration
 
-    def desired_gap(self, ego_vehicle, front_obj, projected: bool = True) -> float:
+    def desired_gap(self, ego_vehicle, front_obj, projected: bool = True, ego_speed=None) -> float:
         d0 = self.DISTANCE_WANTED
         tau = self.TIME_WANTED
         ab = -self.ACC_FACTOR * self.DEACC_FACTOR
-        dv = np.dot(ego_vehicle.velocity - front_obj.velocity, ego_vehicle.heading) if projected \
-            else ego_vehicle.speed - front_obj.speed
-        d_star = d0 + ego_vehicle.speed * tau + ego_vehicle.speed * dv / (2 * np.sqrt(ab))
+        ego_speed = ego_vehicle.speed if ego_speed is None else ego_speed
+        dv = np.dot(ego_speed * ego_vehicle.velocity_direction - front_obj.velocity, ego_vehicle.heading) \
+            if projected else ego_speed - front_obj.speed
+        d_star = d0 + ego_speed * tau + ego_speed * dv / (2 * math.sqrt(ab))
         return d_star
 
     def reset(self):
@@ -0,0 +1,20 @@
+from panda3d.core import NodePath
+
+from pgdrive.component.algorithm.BIG import BIG, BigGenerateMethod
+from pgdrive.component.road.road_network import RoadNetwork
+from pgdrive.engine.core.physics_world import PhysicsWorld
+
+
+def test_big_restart_removes_discarded_blocks():
+    global_network = RoadNetwork()
+    big = BIG(3, 3.5, global_network, NodePath("render"), PhysicsWorld(), random_seed=0, max_trials=7)
+    big.generate(BigGenerateMethod.BLOCK_NUM, 6)
+    assert big._restart_num > 0, "The trial budget is too large to trigger a restart"
+    nodes = set()
+    for block in big.blocks:
+        nodes.update(block.block_network.graph.keys())
+    assert set(global_network.graph.keys()) == nodes
+
+
+if __name__ == '__main__':
+    test_big_restart_removes_discarded_blocks()
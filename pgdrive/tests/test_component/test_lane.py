@@ -0,0 +1,46 @@
+import numpy as np
+
+from pgdrive.component.lane import _straight_kernels
+from pgdrive.component.lane.straight_lane import StraightLane
+
+
+def test_straight_lane_local_coordinates_batch():
+    lane = StraightLane([3.0, -2.0], [40.0, 25.0])
+    positions = np.random.normal(0, 50, size=(100, 2))
+    batch = lane.local_coordinates_batch(positions)
+    assert batch.shape == (100, 2)
+    for pos, ret in zip(positions, batch):
+        assert np.allclose(lane.local_coordinates(pos), ret)
+
+
+def test_straight_lane_local_coordinates_after_reset_start_end():
+    lane = StraightLane([3.0, -2.0], [40.0, 25.0])
+    position = np.array([10.0, 4.0])
+    lane.local_coordinates(position)
+    lane.reset_start_end(lane.position(0, 3.5), lane.position(lane.length, 3.5))
+    assert np.allclose(lane.local_coordinates(position), lane.local_coordinates_batch([position])[0])
+
+
+def test_straight_lane_local_coordinates_same_for_all_inputs():
+    lane = StraightLane([3.0, -2.0], [40.0, 25.0])
+    position = np.array([10.3, 4.7], dtype=np.float32)
+    ret = lane.local_coordinates(position)
+    assert ret == lane.local_coordinates(position.astype(np.float64))
+    assert ret == lane.local_coordinates([float(position[0]), float(position[1])])
+    assert all(isinstance(v, float) for v in ret)
+
+
+def test_straight_lane_position_same_with_and_without_numba():
+    lane = StraightLane([3.0, -2.0], [40.0, 25.0])
+    args = (lane.start, lane.direction, lane.direction_lateral, 17.3, 1.7)
+    ret = _straight_kernels.position(*args)
+    expected = _straight_kernels._position(*args)
+    assert ret.dtype == expected.dtype
+    assert np.array_equal(ret, expected)
+
+
+if __name__ == '__main__':
+    test_straight_lane_local_coordinates_batch()
+    test_straight_lane_local_coordinates_after_reset_start_end()
+    test_straight_lane_local_coordinates_same_for_all_inputs()
+    test_straight_lane_position_same_with_and_without_numba()
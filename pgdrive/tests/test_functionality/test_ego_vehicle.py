@@ -78,10 +78,11 @@ def test_base_vehicle():
 def _nan_speed(pg_env):
     steering = [-np.nan, -1, 0, 1, np.nan]
     acc_brake = [-np.nan, -1, 0, 1, np.nan]
+    # all (steering, acc_brake) pairs in the order of nested loops, steering being the outer one
+    actions = np.array(np.meshgrid(steering, acc_brake, indexing="ij")).reshape(2, -1).T.astype(np.float32)
     pg_env.reset()
-    for s in steering:
-        for a in acc_brake:
-            pg_env.step([s, a])
+    for action in actions:
+        pg_env.step(action)
 
 
 if __name__ == '__main__':
@@ -2,7 +2,7 @@ from typing import Union, Tuple
 
 from direct.showbase import ShowBase
 from panda3d.bullet import BulletPlaneShape, BulletRigidBodyNode, BulletDebugNode
-from panda3d.core import Vec3, NodePath, LineSegs
+from panda3d.core import Vec3, NodePath, LineSegs, loadPrcFileData
 
 from pgdrive.component.algorithm.BIG import NextStep
 from pgdrive.component.map.base_map import BaseMap
@@ -11,8 +11,14 @@ from pgdrive.engine.core.physics_world import PhysicsWorld
 
 
 class TestBlock(ShowBase.ShowBase):
+    """
+    An onscreen viewer of one road network, used by the vis_* scripts to inspect blocks interactively.
+    All blocks are attached to the same render tree, so they are drawn by one camera in one pass per frame
+    """
     def __init__(self, debug=False):
         self.debug = debug
+        # reuse decoded textures from the model cache across launches, like the engine does
+        loadPrcFileData("", "model-cache-textures 1")
         super(TestBlock, self).__init__(windowType="onscreen")
         self.setBackgroundColor(38 / 255, 58 / 255, 102 / 255, 1)
         self.setFrameRateMeter(True)
@@ -54,6 +60,8 @@ class TestBlock(ShowBase.ShowBase):
         self.physics_world = self.world
 
         # World
+        # debug=True draws the wireframe of Bullet shapes instead of skipping them, e.g. vis_no_render.py inspects
+        # the physics bodies of blocks built by BIG in this way
         if self.debug:
             self.debugNP = self.worldNP.attachNewNode(BulletDebugNode('Debug'))
             self.debugNP.show()
@@ -109,9 +117,15 @@ class TestBlock(ShowBase.ShowBase):
     def show_bounding_box(self, road_network):
         bound_box = road_network.get_bounding_box()
         points = [(x, -y) for x in bound_box[:2] for y in bound_box[2:]]
+        # all edges go into one LineSegs, so that the box is drawn by a single node instead of one node per edge
+        line_seg = LineSegs("bounding_box")
+        line_seg.setColor(1, 0., 0., 1)
+        line_seg.setThickness(2)
         for k, p in enumerate(points[:-1]):
             for p_ in points[k + 1:]:
-                self.add_line((*p, 2), (*p_, 2), (1, 0., 0., 1), 2)
+                line_seg.moveTo((*p, 2))
+                line_seg.drawTo((*p_, 2))
+        NodePath(line_seg.create(False)).reparentTo(self.render)
 
 
 if __name__ == "__main__":
@@ -13,12 +13,11 @@ if __name__ == "__main__":
     curve = FirstPGBlock(global_network, 3.0, 1, test.render, test.world, 1)
     for i in range(1, 13):
         curve = Curve(i, curve.get_socket(0), global_network, i)
-        print(i)
-        while True:
-            success = curve.construct_block(test.render, test.world)
-            print(success)
-            if success:
-                break
+        trials = 1
+        while not curve.construct_block(test.render, test.world, skip_failed_block=True):
             curve.destruct_block(test.world)
+            trials += 1
+        # report once per block, a bad seed can take many trials
+        print("Curve {} is built after {} trial(s)".format(i, trials))
     test.show_bounding_box(global_network)
     test.run()
@@ -13,7 +13,7 @@ if __name__ == "__main__":
 
     # Since some change to generate function, specify the block num to the big
     big.block_num = len("CrTRXOS")
-    big._block_sequence = "CrTRXOS"
+    big._block_sequence = BIG._resolve_block_sequence("rTRXOS")
     test.vis_big(big)
 
     # big.generate(BigGenerateMethod.BLOCK_NUM, 10)
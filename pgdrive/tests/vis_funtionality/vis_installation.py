@@ -1,8 +1,8 @@
-import os
 import sys
 
+import numpy as np
 from PIL import Image
-from panda3d.core import PNMImage, loadPrcFileData
+from panda3d.core import Filename, loadPrcFileData
 
 from pgdrive.envs.pgdrive_env import PGDriveEnv
 
@@ -20,16 +20,17 @@ def capture_image(headless):
     env.reset()
     for i in range(10):
         env.step([0, 1])
-    img = PNMImage()
-    env.engine.win.getScreenshot(img)
-    img.write("vis_installation.png")
-    env.close()
     if not headless:
-        im = Image.open("vis_installation.png")
-        im.show()
-        os.remove("vis_installation.png")
+        # read the framebuffer as an array directly, no need to go through PNMImage and a temporary file
+        tex = env.engine.win.getScreenshot()
+        img = np.frombuffer(tex.getRamImageAs("RGB"), dtype=np.uint8)
+        img = img.reshape((tex.getYSize(), tex.getXSize(), 3))[::-1]
+        env.close()
+        Image.fromarray(img).show()
         print("Offscreen render launched successfully! \n ")
     else:
+        env.engine.win.saveScreenshot(Filename("vis_installation.png"))
+        env.close()
         print(
             "Headless mode Offscreen render launched successfully! \n "
             "A image named \'tset_install.png\' is saved. Open it to check if offscreen mode works well"
@@ -38,6 +39,9 @@ def capture_image(headless):
 
 def vis_installation(headless=True):
     loadPrcFileData("", "notify-level-task fatal")
+    # Physics and offscreen rendering are checked by two envs on purpose: the first one doesn't need a graphics
+    # context, so it still passes on machines where only the rendering is broken. Offscreen rendering can not be
+    # turned on after the engine is launched either
     try:
         env = PGDriveEnv({"use_render": False, "offscreen_render": False})
         env.reset()
@@ -113,9 +113,8 @@ class Config:
         new_dict = new_dict or dict()
         new_dict = copy.deepcopy(new_dict)
         if not allow_add_new_key:
-            old_keys = set(self._config)
-            new_keys = set(new_dict)
-            diff = new_keys.difference(old_keys)
+            # set difference on the key views, without building a set of every existing key
+            diff = new_dict.keys() - self._config.keys()
             if len(diff) > 0:
                 raise KeyError(
                     "'{}' does not exist in existing config. "
@@ -1,6 +1,8 @@
 import logging
 import math
 
+import numpy as np
+
 
 def _get_fake_cutils():
     class FakeCutils:
@@ -44,15 +46,18 @@ def _get_fake_cutils():
             colors = []
             pg_start_position = cls.cutils_panda_position(vehicle_position_x, vehicle_position_y, height)
 
+            # compute the ends of all lasers at once, which is the same as cutils_get_laser_end() for each laser
+            laser_angles = lidar_range[:num_lasers] + heading_theta
+            laser_ends_x = (perceive_distance * np.cos(laser_angles) + vehicle_position_x).tolist()
+            laser_ends_y = (perceive_distance * np.sin(laser_angles) + vehicle_position_y).tolist()
+
             for laser_index in range(num_lasers):
                 if (detector_mask is not None) and (not detector_mask[laser_index]):
                     # update vis
                     if require_colors:
-                        point_x, point_y = cls.cutils_get_laser_end(
-                            lidar_range, perceive_distance, laser_index, heading_theta, vehicle_position_x,
-                            vehicle_position_y
+                        point_x, point_y, point_z = cls.cutils_panda_position(
+                            laser_ends_x[laser_index], laser_ends_y[laser_index], height
                         )
-                        point_x, point_y, point_z = cls.cutils_panda_position(point_x, point_y, height)
                         colors.append(
                             cls.cutils_add_cloud_point_vis(
                                 point_x, point_y, height, num_lasers, laser_index, ANGLE_FACTOR, MARK_COLOR0,
@@ -62,10 +67,7 @@ def _get_fake_cutils():
                     continue
 
                 # # coordinates problem here! take care
-                point_x, point_y = cls.cutils_get_laser_end(
-                    lidar_range, perceive_distance, laser_index, heading_theta, vehicle_position_x, vehicle_position_y
-                )
-                laser_end = cls.cutils_panda_position(point_x, point_y, height)
+                laser_end = cls.cutils_panda_position(laser_ends_x[laser_index], laser_ends_y[laser_index], height)
                 result = physics_world.rayTestClosest(pg_start_position, laser_end, mask)
                 node = result.getNode()
                 if node in extra_filter_node:
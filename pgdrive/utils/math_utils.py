@@ -158,12 +158,10 @@ def get_points_bounding_box(line_points):
     :param line_points: Key points on lines
     :return: bounding box
     """
-    new_line_points = np.array(line_points)
-    new_x_max = new_line_points[:, 0].max()
-    new_x_min = new_line_points[:, 0].min()
-    new_y_max = new_line_points[:, 1].max()
-    new_y_min = new_line_points[:, 1].min()
-    return new_x_max, new_x_min, new_y_max, new_y_min
+    # Only a handful of points are passed in, for which plain Python is cheaper than building an array
+    xs = [float(point[0]) for point in line_points]
+    ys = [float(point[1]) for point in line_points]
+    return max(xs), min(xs), max(ys), min(ys)
 
 
 def get_boxes_bounding_box(boxes):
@@ -10,6 +10,7 @@ from panda3d.core import Vec3
 
 from pgdrive.component.lane.abs_lane import AbstractLane
 from pgdrive.component.lane.circular_lane import CircularLane
+from pgdrive.component.lane.straight_lane import StraightLane
 from pgdrive.constants import Decoration, BodyName
 from pgdrive.engine.core.engine_core import EngineCore
 from pgdrive.utils.coordinates_shift import panda_heading
@@ -44,11 +45,14 @@ def check_lane_on_road(
     Calculate if the new lane intersects with other lanes in current road network
     The return Value is True when cross
     Note: the decoration road will be ignored in default
+    Note: the check is done in full float precision on purpose, since a coarser one accepts or rejects different
+    blocks and thus changes the map generated from the same seed
     """
     assert ignore_intersection_checking is not None
     if ignore_intersection_checking:
         return True
     graph = road_network.graph
+    x_max_2, x_min_2, y_max_2, y_min_2 = get_road_bounding_box([lane])
     for _from, to_dict in graph.items():
         for _to, lanes in to_dict.items():
             if ignored and (_from, _to) == ignored:
@@ -57,11 +61,25 @@ def check_lane_on_road(
                 continue
             if len(lanes) == 0:
                 continue
-            x_max_1, x_min_1, y_max_1, y_min_1 = get_road_bounding_box(lanes)
-            x_max_2, x_min_2, y_max_2, y_min_2 = get_road_bounding_box([lane])
+            x_max_1, x_min_1, y_max_1, y_min_1 = road_network.get_road_bounding_box(_from, _to)
             if x_min_1 > x_max_2 or x_min_2 > x_max_1 or y_min_1 > y_max_2 or y_min_2 > y_max_1:
                 continue
+            sample_points = None
             for _id, l in enumerate(lanes):
+                if isinstance(l, StraightLane):
+                    if sample_points is None:
+                        sample_points = np.array(
+                            [
+                                lane.position(i,
+                                              positive * lane.width_at(i) / 2.0) for i in range(1, int(lane.length), 1)
+                            ]
+                        ).reshape(-1, 2)
+                    local = l.local_coordinates_batch(sample_points)
+                    longitudinal, lateral = local[:, 0], local[:, 1]
+                    is_on = (np.abs(lateral) <= l.width / 2.0) & (0 <= longitudinal) & (longitudinal <= l.length)
+                    if is_on.any():
+                        return True
+                    continue
                 for i in range(1, int(lane.length), 1):
                     sample_point = lane.position(i, positive * lane.width_at(i) / 2.0)
                     longitudinal, lateral = l.local_coordinates(sample_point)